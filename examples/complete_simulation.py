@@ -1,22 +1,33 @@
 from typing import List
+from functools import partial
+from pathlib import Path
+import multiprocessing as mp
 import argparse
-from random import randint
+import os
 
+import h5py
 import numpy as np
 
 import gridsim as gs
 from random_robot import RandomRobot
 
 
-def green_agg(robots: List[gs.Robot]) -> np.ndarray:
+def green_agg(world: gs.World, robots: List[gs.Robot],
+              out: np.ndarray = None) -> np.ndarray:
     """
     This is a dummy aggregator function (for demonstration) that just saves
     the value of each robot's green color channel
 
     Parameters
     ----------
+    world : gs.World
+        World the robots are in (bound with ``functools.partial`` when the
+        aggregator is added)
     robots : List[gs.Robot]
         All robots from the World (sent by the Logger)
+    out : np.ndarray, optional
+        Array to write the output into (sent by the Logger), so that a new
+        array doesn't need to be created every time
 
     Returns
     -------
@@ -29,18 +40,31 @@ def green_agg(robots: List[gs.Robot]) -> np.ndarray:
 
     # robots = list(filter(lambda r: isinstance(r, RandomRobot), robots))
 
-    out_arr = np.zeros([len(robots)])
-    for i, r in enumerate(robots):
-        out_arr[i] = r._color[1]
+    # The World stores the colors of all robots in a single array, so we can
+    # get the green channel of every robot at once instead of looping
+    green = world.get_colors()[:, 1]
+    if out is None:
+        return green.astype(np.float64)
+    out[:] = green
+    return out
 
-    return out_arr
 
+def run_trial(trial: int, config: gs.ConfigParser, log_filename: str,
+              show_viewer: bool = True):
+    """
+    Run a single simulation trial and log its data
 
-def main(config_file: str):
-    # Import configuration
-    config = gs.ConfigParser(config_file)
-    print('STARTING', config.get('name'))
-
+    Parameters
+    ----------
+    trial : int
+        Trial number (used to save the data)
+    config : gs.ConfigParser
+        Configuration for the simulation
+    log_filename : str
+        HDF5 file to save the trial data in
+    show_viewer : bool, optional
+        Whether to display the simulation, by default True
+    """
     # Number of cells in the width/height of the square grid
     grid_w = config.get('grid_width')
 
@@ -48,42 +72,110 @@ def main(config_file: str):
     # Use a default communication range if one is not in the configuration
     comm_range = config.get('comm_range', default=6)
     overwrite_trials = config.get('overwrite_trials', default=False)
+    environment_img = config.get('environment_img')
+    num_steps = config.get('num_steps')
+
+    # Random starting positions for all the robots (drawn all at once)
+    rng = np.random.default_rng()
+    xs = rng.integers(0, grid_w, num_robots)
+    ys = rng.integers(0, grid_w, num_robots)
+    robots = [RandomRobot(int(x), int(y), comm_range=comm_range)
+              for x, y in zip(xs, ys)]
+    # Create the World, with the robots in it
+    world = gs.World(grid_w, grid_w, robots=robots)
+    # Add the image to the World
+    world.add_environment(environment_img)
+
+    # Create the viewer
+    viewer = gs.Viewer(world, display_rate=10,
+                       show_grid=False, window_width=1000,
+                       enabled=show_viewer)
+
+    # Logger
+    # (The buffer and chunk sizes and compression only affect how fast data is saved and the file
+    # size, not the data)
+    logger = gs.Logger(world, log_filename, trial_num=trial,
+                       overwrite_trials=overwrite_trials,
+                       buffer_size=config.get('hdf5_buffer_size', default=1024),
+                       chunk_size=config.get('hdf5_chunk_size'),
+                       compression=config.get('hdf5_compression'))
+    logger.add_aggregator('green', partial(green_agg, world))
+    logger.log_config(config)
+
+    # Run the simulation
+    for n in range(num_steps):
+        # Run a single step of the
+        world.step()
+        # Draw the updated world state
+        viewer.draw()
+        # Save the state of the World using the aggregators
+        logger.log_state()
+    # Make sure all of the logged data is written to the file
+    logger.close()
+    print(f'TRIAL {trial} FINISHED')
+
+
+def run_parallel_trial(trial: int, config: gs.ConfigParser,
+                       log_filename: str) -> str:
+    """
+    Run a trial in a worker process. HDF5 files can't be written by multiple
+    processes at once, so each trial is logged to its own file, which is
+    merged into the main log file when all trials are done.
+
+    Returns
+    -------
+    str
+        Name of the file the trial was logged to
+    """
+    log_path = Path(log_filename).expanduser()
+    trial_filename = str(log_path.with_name(f'{log_path.stem}_trial_{trial}.h5'))
+    # Workers can't share a display, so don't show the Viewer
+    run_trial(trial, config, trial_filename, show_viewer=False)
+    return trial_filename
+
+
+def merge_trial_files(trial_filenames: List[str], log_filename: str,
+                      overwrite_trials: bool):
+    """
+    Copy the trials logged in separate files (by parallel workers) into the
+    main log file, and delete the separate files.
+    """
+    with h5py.File(Path(log_filename).expanduser(), 'a') as log_file:
+        for trial_filename in trial_filenames:
+            with h5py.File(trial_filename, 'r') as trial_file:
+                for trial_name in trial_file:
+                    if trial_name in log_file:
+                        if not overwrite_trials:
+                            raise ValueError(f'Conflicts with existing {trial_name}. '
+                                             'Exiting to avoid data overwrite')
+                        del log_file[trial_name]
+                    trial_file.copy(trial_name, log_file)
+            os.remove(trial_filename)
+
+
+def main(config_file: str):
+    # Import configuration
+    config = gs.ConfigParser(config_file)
+    print('STARTING', config.get('name'))
+
     start_trial = config.get('start_trial', default=1)
     end_trial = config.get('end_trial')
-
-    for trial in range(start_trial, end_trial+1):
-
-        robots = []
-        for n in range(num_robots):
-            robots.append(RandomRobot(randint(0, grid_w-1),
-                                      randint(0, grid_w-1),
-                                      comm_range=comm_range))
-        # Create the World, with the robots in it
-        world = gs.World(grid_w, grid_w, robots=robots)
-        # Add the image to the World
-        world.add_environment(config.get('environment_img'))
-
-        # Create the viewer
-        viewer = gs.Viewer(world, display_rate=10,
-                           show_grid=False, window_width=1000)
-
-        # Logger
-        log_filename = config.get('log_filename')
-        logger = gs.Logger(world, log_filename, trial_num=trial,
-                           overwrite_trials=overwrite_trials)
-        logger.add_aggregator('green', green_agg)
-        logger.log_config(config)
-
-        num_steps = config.get('num_steps')
-        # Run the simulation
-        for n in range(num_steps):
-            # Run a single step of the
-            world.step()
-            # Draw the updated world state
-            viewer.draw()
-            # Save the state of the World using the aggregators
-            logger.log_state()
-        print(f'TRIAL {trial} FINISHED')
+    log_filename = config.get('log_filename')
+    # Number of trials to run at the same time (in separate processes)
+    num_workers = config.get('num_workers', default=1)
+    trials = range(start_trial, end_trial+1)
+
+    if num_workers > 1:
+        with mp.get_context('spawn').Pool(num_workers) as pool:
+            trial_filenames = pool.map(
+                partial(run_parallel_trial, config=config,
+                        log_filename=log_filename),
+                trials)
+        merge_trial_files(trial_filenames, log_filename,
+                          config.get('overwrite_trials', default=False))
+    else:
+        for trial in trials:
+            run_trial(trial, config, log_filename)
 
     print('SIMULATION FINISHED')
 
@@ -11,6 +11,7 @@ def main():
     # You can specify a default value in case a parameter isn't in the
     # configuration file
     num_steps = config.get('num_steps', default=100)
+    verbose = config.get('verbose', default=False)
 
     # Create a few robots to place in your world
     robots = []
@@ -27,8 +28,10 @@ def main():
     for n in range(num_steps):
         # Execute a simulation step
         world.step()
-        # To make sure it works, print the tick (world time)
-        print('Time:', world.get_time())
+        # To make sure it works, print the tick (world time) every 10 steps
+        # (Printing on every step can slow down a fast simulation)
+        if verbose and world.get_time() % 10 == 0:
+            print('Time:', world.get_time())
 
     print('SIMULATION FINISHED')
 
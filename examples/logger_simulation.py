@@ -1,21 +1,19 @@
 import gridsim as gs
 from typing import List
+from functools import partial
 import numpy as np
 from datetime import datetime
 
 from random_robot import RandomRobot
 
 
-def green_agg(robots: List[gs.Robot]) -> np.ndarray:
+def green_agg(world: gs.World, robots: List[gs.Robot]) -> np.ndarray:
     """
     This is a dummy aggregator function (for demonstration) that just saves
     the value of each robot's green color channel
     """
-    out_arr = np.zeros([len(robots)])
-    for i, r in enumerate(robots):
-        out_arr[i] = r._color[1]
-
-    return out_arr
+    # Colors of all robots are stored together in the World
+    return world.get_colors()[:, 1].astype(np.float64)
 
 
 def main():
@@ -26,6 +24,7 @@ def main():
     # You can specify a default value in case a parameter isn't in the
     # configuration file
     num_steps = config.get('num_steps', default=100)
+    verbose = config.get('verbose', default=False)
 
     # Create a few robots to place in your world
     robots = []
@@ -45,9 +44,9 @@ def main():
                        overwrite_trials=True)
     # Tell the logger to run the `green_agg` function every time that
     # `log_state` is called
-    logger.add_aggregator('green', green_agg)
+    logger.add_aggregator('green', partial(green_agg, world))
     # Save the contents of the configuration, but leave out the 'name' parameter
-    logger.log_config(config, exclude='name')
+    logger.log_config(config, exclude=['name'])
     # Save the date/time that the simulation was run
     logger.log_param('date', str(datetime.now()))
 
@@ -59,8 +58,13 @@ def main():
         # Log the state every step
         logger.log_state()
 
-        # To make sure it works, print the tick (world time)
-        print('Time:', world.get_time())
+        # To make sure it works, print the tick (world time) every 10 steps
+        # (Printing on every step can slow down a fast simulation)
+        if verbose and world.get_time() % 10 == 0:
+            print('Time:', world.get_time())
+
+    # Write any remaining logged data to the file
+    logger.close()
 
     print('SIMULATION FINISHED')
 
@@ -7,6 +7,7 @@ def main():
     grid_width = 50  # Number of cells for the width & height of the world
     num_robots = 5
     num_steps = 100  # simulation steps to run
+    verbose = True  # Print the time while the simulation runs
 
     # Create a few robots to place in your world
     robots = []
@@ -23,8 +24,10 @@ def main():
     for n in range(num_steps):
         # Execute a simulation step
         world.step()
-        # To make sure it works, print the tick (world time)
-        print('Time:', world.get_time())
+        # To make sure it works, print the tick (world time) every 10 steps
+        # (Printing on every step can slow down a fast simulation)
+        if verbose and world.get_time() % 10 == 0:
+            print('Time:', world.get_time())
 
     print('SIMULATION FINISHED')
 
@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 from gridsim.grid_robot import GridRobot
 import gridsim as gs
@@ -8,6 +8,18 @@ class RandomRobot(GridRobot):
     # Change direction every 10 ticks
     DIR_DURATION = 10
 
+    # Random directions are drawn from numpy in large batches (shared by all
+    # RandomRobots), which is much faster than drawing them one at a time
+    _DIR_BATCH_SIZE = 4096
+    _random_dirs = []
+
+    @staticmethod
+    def _random_dir() -> int:
+        if not RandomRobot._random_dirs:
+            inds = np.random.randint(len(GridRobot.DIRS), size=RandomRobot._DIR_BATCH_SIZE)
+            RandomRobot._random_dirs = np.asarray(GridRobot.DIRS)[inds].tolist()
+        return RandomRobot._random_dirs.pop()
+
     def init(self):
         self.set_color(255, 0, 0)
         self._msg_sent = False
@@ -15,6 +27,10 @@ class RandomRobot(GridRobot):
         # Next tick when Robot will change direction
         self._next_dir_change = self.get_tick()
 
+        # Broadcast a test message to any robots nearby. The message keeps being
+        # sent until it's changed, so we only need to set it once.
+        self.set_tx_message(gs.Message(self.id, {'test': 'hello'}))
+
     def receive_msg(self, msg: gs.Message, dist_sqr: float):
         # This robot got a message from another robot
         self._msg_sent = True
@@ -23,14 +39,10 @@ class RandomRobot(GridRobot):
         # Change direction every DIR_DURATION ticks
         tick = self.get_tick()
         if tick >= self._next_dir_change:
-            new_dir = random.choice(GridRobot.DIRS)
+            new_dir = RandomRobot._random_dir()
             self.set_direction(new_dir)
             self._next_dir_change = tick + RandomRobot.DIR_DURATION
 
-        # Broadcast a test message to any robots nearby
-        msg = gs.Message(self.id, {'test': 'hello'})
-        self.set_tx_message(msg)
-
         # Sample the environment at the current location
         c = self.sample()
 
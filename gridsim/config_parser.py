@@ -14,10 +14,15 @@ configuration parameter types can be saved to log files. For details, see the
 
 """
 
-from typing import Any, Optional
+from typing import Any, Optional, Dict, Tuple
 import warnings
 
 import yaml
+try:
+    # Use the (much faster) C implementation of the YAML parser, if libyaml is available
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore
 
 
 class ConfigParser:
@@ -39,7 +44,9 @@ class ConfigParser:
     def __init__(self, config_filename: str, show_warnings: bool = False):
         self._show_warnings = show_warnings
         with open(config_filename) as f:
-            self._params = yaml.load(f, Loader=yaml.FullLoader)
+            self._params = yaml.load(f, Loader=_Loader)
+        # Previously looked-up values, keyed by (key, default)
+        self._cache: Dict[Tuple[str, Any], Any] = {}
 
     def get(self, key: Optional[str] = None, default: Any = None) -> Any:
         """
@@ -51,6 +58,11 @@ class ConfigParser:
         If no default is specified and the key is *not* found in the configuration file,
         this will return ``None`` instead of rasing an exception.
 
+        Note
+        ----
+        Values are cached after the first lookup, so if ``show_warnings`` is enabled, the warning
+        for a missing key is only shown the first time it is looked up.
+
         Parameters
         ----------
         key : str, optional
@@ -68,8 +80,20 @@ class ConfigParser:
         """
         if key is None:
             return self._params
-        else:
-            val = self._params.get(key, default)
-            if val is None and self._show_warnings:
-                warnings.warn(f'Configuration value for key "{key}" is None')
-            return val
+        try:
+            return self._cache[(key, default)]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable default (e.g., a list) can't be cached
+            return self._lookup(key, default)
+        val = self._lookup(key, default)
+        self._cache[(key, default)] = val
+        return val
+
+    def _lookup(self, key: str, default: Any) -> Any:
+        # Uncached lookup of a single configuration value (see get)
+        val = self._params.get(key, default)
+        if val is None and self._show_warnings:
+            warnings.warn(f'Configuration value for key "{key}" is None')
+        return val
@@ -1,11 +1,31 @@
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 from pathlib import Path
+import hashlib
+import os
 
 import pygame
 from PIL import Image
 import numpy as np
 
 
+def _default_cache_dir() -> Optional[Path]:
+    """
+    Get the default directory where resized environment images are cached, so they only need to be
+    resized once. This is ``$GRIDSIM_CACHE_DIR``, if it is set (if it's set to an empty value,
+    caching is turned off). Otherwise, it's ``gridsim`` in the user's cache directory
+    (``$XDG_CACHE_HOME``, or ``~/.cache`` if that isn't set).
+
+    Returns
+    -------
+    Path or None
+        Cache directory, or None if caching is turned off
+    """
+    cache_dir = os.getenv('GRIDSIM_CACHE_DIR')
+    if cache_dir is not None:
+        return Path(cache_dir).expanduser() if cache_dir else None
+    return Path(os.getenv('XDG_CACHE_HOME') or '~/.cache').expanduser() / 'gridsim'
+
+
 class Environment:
     """
     A null class representing both empty and non-empty Environments
@@ -33,6 +53,23 @@ class Environment:
         """
         return 0, 0, 0
 
+    def get_many(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Get the RGB colors of many cells at once. For a null environment, these are all (0, 0, 0)
+        (black).
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            (K, 2) array of (x, y) grid cell positions for which to get the color
+
+        Returns
+        -------
+        np.ndarray
+            (K, 3) array of zeros -- Null environment's color is always considered black.
+        """
+        return np.zeros([len(positions), 3])
+
     def add_to_viewer(self, window_dim: Tuple[int, int]):
         """
         When a Viewer is created, this function is called to generate the pygame image for drawing.
@@ -88,20 +125,36 @@ class ImageEnvironment(Environment):
         image in each cell. If non-zero (should be >= 0), each component of the observations will be
         drawn from a normal distribution with mean at the image value, and using this standard
         deviation.
+    cache : Union[bool, str], optional
+        Whether to cache the image after resizing it to the grid dimensions, so it doesn't need to
+        be resized again (e.g., in the next trial), by default True. By default, it's cached in
+        ``$GRIDSIM_CACHE_DIR`` (if set; set it to an empty value to turn off caching) or else in
+        ``$XDG_CACHE_HOME/gridsim`` (``~/.cache/gridsim`` if ``XDG_CACHE_HOME`` is not set). You
+        can also give the directory to cache it in, or False to not cache it.
     """
 
-    def __init__(self, img_filename: str, grid_dim: Tuple[int, int], observation_std: float = 0.):
+    def __init__(self, img_filename: str, grid_dim: Tuple[int, int], observation_std: float = 0.,
+                 cache: Union[bool, str] = True):
         super().__init__()
 
+        if cache is True:
+            self._cache_dir = _default_cache_dir()
+        elif cache:
+            self._cache_dir = Path(cache).expanduser()
+        else:
+            self._cache_dir = None
+
         self._img_filename = Path(img_filename).expanduser().resolve()
 
         # Get the scaling between image dimensions and grid world dimensions
-        img = Image.open(self._img_filename).convert('RGB')
         self._world_dim = grid_dim
+        img = Image.open(self._img_filename)
         if img.size == grid_dim:
-            self._world_img = img
+            world_arr = np.asarray(img.convert('RGB'))
         else:
-            self._world_img = img.resize(grid_dim, Image.LANCZOS)
+            world_arr = self._load_resized(img)
+        # Array of [height, width, RGB] for fast lookup of cell colors
+        self._world_arr = np.ascontiguousarray(world_arr, dtype=np.uint8)
 
         self._observation_std = observation_std
 
@@ -109,6 +162,47 @@ class ImageEnvironment(Environment):
         # All non-empty environments are True
         return True
 
+    def _load_resized(self, img: Image.Image) -> np.ndarray:
+        """
+        Get the environment image resized to the World's grid dimensions. Resizing is slow for large
+        images, so the result is cached (see the ``cache`` argument) and re-used as long as the
+        image file hasn't changed.
+
+        Parameters
+        ----------
+        img : Image.Image
+            Opened environment image (at its original size)
+
+        Returns
+        -------
+        np.ndarray
+            [height, width, RGB] array of the resized image
+        """
+        cache_dir = self._cache_dir
+        if cache_dir is not None:
+            mtime = self._img_filename.stat().st_mtime_ns
+            key = f'{self._img_filename}:{mtime}:{self._world_dim}'
+            cache_file = cache_dir / f'env_{hashlib.sha1(key.encode()).hexdigest()}.npy'
+            try:
+                return np.load(cache_file)
+            except (OSError, ValueError):
+                pass
+
+        world_arr = np.asarray(img.convert('RGB').resize(self._world_dim, Image.LANCZOS))
+        if cache_dir is None:
+            return world_arr
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so other processes never load a partial file
+            tmp_file = cache_file.with_name(f'{cache_file.stem}.{os.getpid()}.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.save(f, world_arr)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Caching is only an optimization, so it's fine if it isn't possible
+            pass
+        return world_arr
+
     def get(self, pos: Tuple[int, int]) -> Optional[Tuple[float, float, float]]:
         """
         Get the RGB color in the given (x,y) cell
@@ -126,13 +220,39 @@ class ImageEnvironment(Environment):
         """
         # Get color in this grid cell
         if (0 <= pos[0] < self._world_dim[0]) and (0 <= pos[1] < self._world_dim[1]):
-            color = self._world_img.getpixel(pos)
+            color = self._world_arr[int(pos[1]), int(pos[0])]
         else:
             return None
         if self._observation_std != 0:
-            return tuple(np.random.normal(c, self._observation_std) for c in color)
-        else:
-            return color
+            # Draw noise for all three channels at once
+            color = np.random.normal(color, self._observation_std)
+        return tuple(color.tolist())
+
+    def get_many(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Get the RGB colors of many cells at once. This is much faster than calling
+        :meth:`~gridsim.environment.ImageEnvironment.get` for each cell.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            (K, 2) array of (x, y) grid cell positions for which to get the color
+
+        Returns
+        -------
+        np.ndarray
+            (K, 3) array of the (red, green, blue) color in each cell. Rows for positions outside
+            of the arena/image are NaN.
+        """
+        positions = np.asarray(positions, dtype=np.intp).reshape(-1, 2)
+        xs, ys = positions[:, 0], positions[:, 1]
+        in_bounds = (xs >= 0) & (xs < self._world_dim[0]) & (ys >= 0) & (ys < self._world_dim[1])
+        colors = np.full([len(positions), 3], np.nan)
+        colors[in_bounds] = self._world_arr[ys[in_bounds], xs[in_bounds]]
+        if self._observation_std != 0:
+            # Noise for every cell and channel is drawn in a single call
+            colors += self._observation_std * np.random.standard_normal(colors.shape)
+        return colors
 
     def add_to_viewer(self, window_dim: Tuple[int, int]):
         """
@@ -149,10 +269,9 @@ class ImageEnvironment(Environment):
         # display window dimensions
         # img = pygame.image.load(self._img_filename).convert()
 
-        # PIL image (1 px = 1 world cell) -> raw bytes
-        raw_str = self._world_img.tobytes("raw", 'RGB')
-        # raw bytes -> Pygame image
-        img = pygame.image.fromstring(raw_str, self._world_img.size, 'RGB')
+        # Image array (1 px = 1 world cell) -> Pygame image
+        # (surfarray is indexed [x, y], so swap the axes of the [y, x] image array)
+        img = pygame.surfarray.make_surface(self._world_arr.swapaxes(0, 1))
         # img = pygame.transform.scale(img, self._world_dim)
         # Scale pygame image to world viewer window dimensions
         self._viewer_img = pygame.transform.scale(img, window_dim)
@@ -1,4 +1,6 @@
-from typing import Tuple
+from typing import Tuple, Optional
+
+import numpy as np
 
 from .robot import Robot
 # If you are building your own Robot class, you would instead use:
@@ -21,18 +23,26 @@ class GridRobot(Robot):
         Communication radius (in grid cells) of the robot, by default 5
     """
 
+    __slots__ = ('_comm_range', '_comm_range_sqr', '_move_cmd', '_move_delta')
+
     #: Robot stays where it is
-    STAY = 'stay'
+    STAY = 0
     #: Robot moves up 1 cell (decrease y position by 1)
-    UP = 'up'
+    UP = 1
     #: Robot moves down 1 cell (increase y position by 1)
-    DOWN = 'down'
+    DOWN = 2
     #: Robot moves left 1 cell (decrease x position by 1)
-    LEFT = 'left'
+    LEFT = 3
     #: Robot moves right 1 cell (increase x position by 1)
-    RIGHT = 'right'
+    RIGHT = 4
 
     DIRS = [STAY, UP, DOWN, LEFT, RIGHT]
+    _DIRS_SET = frozenset(DIRS)
+    #: (dx, dy) movement for each direction (indexed by the direction, as an array for vectorized
+    #: operations)
+    DIR_DELTAS = np.array([[0, 0], [0, -1], [0, 1], [-1, 0], [1, 0]], dtype=np.int8)
+    # Same as DIR_DELTAS, but as tuples (faster for moving a single robot)
+    _DIR_DELTAS = tuple(map(tuple, DIR_DELTAS.tolist()))
 
     def __init__(self, x: int, y: int, comm_range: float = 5):
         # Run all of the initialization for the default Robot class, including
@@ -40,10 +50,19 @@ class GridRobot(Robot):
         super().__init__(x, y)
 
         self._comm_range = comm_range
+        self._comm_range_sqr = comm_range * comm_range
         # Start with the robot stationary
         self._move_cmd = GridRobot.STAY
+        # (dx, dy) to move each step
+        self._move_delta = GridRobot._DIR_DELTAS[GridRobot.STAY]
 
-    def set_direction(self, dir: str):
+    def add_to_world(self, arena_width: int, arena_height: int,
+                     world=None, idx: int = 0):
+        super().add_to_world(arena_width, arena_height, world=world, idx=idx)
+        # Tell the World which direction the robot moves (for moving all robots at once)
+        world._move_cmds[idx] = self._move_cmd
+
+    def set_direction(self, dir: int):
         """
         Helper function to set the direction the robot will move. Note that this will persist (the
         robot will keep moving) until the direction is changed.
@@ -60,10 +79,13 @@ class GridRobot(Robot):
             If given direction is not one of `GridRobot.UP``, ``GridRobot.DOWN``,
             ``GridRobot.LEFT``, ``GridRobot.RIGHT``, or ``GridRobot.STAY``
         """
-        if dir in GridRobot.DIRS:
-            self._move_cmd = dir
-        else:
-            raise ValueError('Invalid movement direction "{dir}"')
+        # (Check the type too, since bools and floats like 1.0 are equal to (and hash like) ints)
+        if type(dir) is not int or dir not in GridRobot._DIRS_SET:
+            raise ValueError(f'Invalid movement direction "{dir}"')
+        self._move_cmd = dir
+        self._move_delta = GridRobot._DIR_DELTAS[self._move_cmd]
+        if self._is_in_world:
+            self._world._move_cmds[self._idx] = self._move_cmd
 
     def move(self) -> Tuple[int, int]:
         """
@@ -76,16 +98,29 @@ class GridRobot(Robot):
             (x,y) grid cell the robot will move to, if possible/allowed
         """
         x, y = self.get_pos()
-        if self._move_cmd == GridRobot.UP:
-            y -= 1
-        elif self._move_cmd == GridRobot.DOWN:
-            y += 1
-        elif self._move_cmd == GridRobot.RIGHT:
-            x += 1
-        elif self._move_cmd == GridRobot.LEFT:
-            x -= 1
-        # else STAY, which keeps current position
-        return x, y
+        dx, dy = self._move_delta
+        return x + dx, y + dy
+
+    @staticmethod
+    def batch_move(pos: np.ndarray, move_cmds: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of :meth:`~gridsim.grid_robot.GridRobot.move`, which determines the cells
+        that many GridRobots will move to at once. The World uses this to move all of the
+        GridRobots that don't override ``move``.
+
+        Parameters
+        ----------
+        pos : np.ndarray
+            (N, 2) array of the (x, y) position of each robot
+        move_cmds : np.ndarray
+            (N,) array of the direction of each robot (e.g., ``GridRobot.UP``)
+
+        Returns
+        -------
+        np.ndarray
+            (N, 2) array of the (x, y) grid cell each robot will move to, if possible/allowed
+        """
+        return pos + GridRobot.DIR_DELTAS[move_cmds]
 
     def comm_criteria(self, dist_sqr: int) -> bool:
         """
@@ -102,4 +137,45 @@ class GridRobot(Robot):
         bool
             Whether distance is <= the communication radius
         """
-        return dist_sqr <= self._comm_range**2
+        return dist_sqr <= self._comm_range_sqr
+
+    def comm_mask(self, dist_sqr: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of :meth:`~gridsim.grid_robot.GridRobot.comm_criteria`, to check the
+        distances to many robots at once.
+
+        Parameters
+        ----------
+        dist_sqr : np.ndarray
+            1D array of SQUARED distances between this robot and other robots
+
+        Returns
+        -------
+        np.ndarray
+            1D boolean array of whether each distance is <= the communication radius
+        """
+        if type(self).comm_criteria is not GridRobot.comm_criteria:
+            # A subclass changed the criterion, so check it for each robot
+            return super().comm_mask(dist_sqr)
+        return dist_sqr <= self._comm_range_sqr
+
+    def get_comm_range(self) -> Optional[float]:
+        """
+        Get the communication radius of the robot, as set at initialization (by default, 5 cells)
+
+        If a subclass changes the communication criterion (by overriding
+        :meth:`~gridsim.grid_robot.GridRobot.comm_criteria` or
+        :meth:`~gridsim.grid_robot.GridRobot.comm_mask`), the radius no longer limits which robots
+        can communicate, so this returns ``None`` (unknown range) unless the subclass also overrides
+        this method.
+
+        Returns
+        -------
+        float or None
+            Communication radius (in grid cells), or ``None`` if the criterion has been changed
+        """
+        cls = type(self)
+        if cls.comm_criteria is not GridRobot.comm_criteria or \
+                cls.comm_mask is not GridRobot.comm_mask:
+            return None
+        return self._comm_range
@@ -39,12 +39,21 @@ Time series data is stored in datasets directly under the ``trial_<n>`` group. T
 :meth:`~gridsim.logger.Logger.add_aggregator`, and new values are added by
 :meth:`~gridsim.logger.Logger.log_state`. Calling this method also adds a value to the ``time``
 dataset, which corresponds to the :class:`~gridsim.world.World` time at which the state was saved.
+
+To avoid writing to the file on every step, logged states are held in memory and written to the
+file in batches, in a background thread (so the simulation can keep running while data is written).
+Call :meth:`~gridsim.logger.Logger.close` at the end of a trial to make sure everything has been
+saved.
 """
 
 from typing import Optional, Callable, List, Dict, Union
 import warnings
-import os
-import re
+import atexit
+import functools
+import inspect
+import queue
+import threading
+import weakref
 from pathlib import Path
 import platform
 from datetime import datetime
@@ -58,6 +67,24 @@ from .config_parser import ConfigParser
 from .utils import get_version
 
 
+# Size of the HDF5 raw data chunk cache for the log file (in bytes)
+_CHUNK_CACHE_BYTES = 16 * 1024**2
+# Number of hash table slots in the chunk cache. This should be a prime number, much larger than the
+# number of chunks that fit in the cache (which can be up to about 2000 for single-value Datasets).
+_CHUNK_CACHE_SLOTS = 20011
+# Default upper limit on the size of each chunk of the time series Datasets (in bytes)
+_MAX_CHUNK_BYTES = 1024**2
+
+# Loggers that haven't been closed yet, to be closed (and their buffers saved) when Python exits
+_open_loggers: 'weakref.WeakSet[Logger]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers():
+    for logger in list(_open_loggers):
+        logger.close()
+
+
 class Logger:
     """
     Logger to save data to an HDF5 file, from a single simulation trial.
@@ -78,6 +105,25 @@ class Logger:
         Trial number under which to save the data.
     overwrite_trials : bool, optional
         Whether to overwrite a trial's data if it already exists, by default False
+    buffer_size : int, optional
+        Number of states (calls to :meth:`~gridsim.logger.Logger.log_state`) to hold in memory
+        before writing them to the file, by default 1024
+    chunk_size : int, optional
+        Number of states stored together in each HDF5 chunk of the time series Datasets. By default,
+        this is the same as the ``buffer_size``, so each write fills whole chunks. (For aggregators
+        with many values per state, the default is reduced to a power of two that keeps each chunk
+        within about 1 MB, so chunks still fit in the chunk cache.)
+    compression : str, optional
+        HDF5 compression filter for aggregator Datasets with more than one value per state (e.g.,
+        one value per Robot), by default None (no compression). ``'lzf'`` is very fast and can make
+        log files much smaller, but files that use it can only be read with h5py. ``'gzip'`` is
+        slower, but can be read by any HDF5 library. Compressed Datasets also use HDF5's shuffle
+        filter, which makes numeric data compress better.
+
+    Raises
+    ------
+    ValueError
+        If ``buffer_size`` or ``chunk_size`` is less than 1
     """
 
     # Allowed parameter datatypes (from configuration) that can be logged
@@ -91,33 +137,69 @@ class Logger:
         list: 'float64',
     }
 
+    #: Per-robot arrays that aggregators can use instead of the list of Robots (see
+    #: :meth:`~gridsim.logger.Logger.add_aggregator`)
+    COLUMNS = ('x', 'y', 'pos', 'color')
+
     @staticmethod
     def type_str(type_v):
-        return re.findall(r"'(.*?)'", str(type_v))[0]
+        # Name of a type (or of the type of a value), e.g., "int"
+        return type_v.__name__ if isinstance(type_v, type) else type(type_v).__name__
 
     def __init__(self, world: World, filename: str, trial_num: int,
-                 overwrite_trials: bool = False):
+                 overwrite_trials: bool = False, buffer_size: int = 1024,
+                 chunk_size: Optional[int] = None, compression: Optional[str] = None):
+        if buffer_size < 1:
+            raise ValueError(f'buffer_size must be at least 1 (not {buffer_size})')
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1 (not {chunk_size})')
         self._world = world
         self._filename = filename
         self._trial_num = trial_num
         self._overwrite_trials = overwrite_trials
         self._log_file = self._create_log_file(filename)
+        self._buffer_size = buffer_size
+        self._chunk_size = chunk_size
+        self._compression = compression
 
         self._trial_group_name = f"trial_{trial_num}"
-        self._params_group_name = os.path.join(self._trial_group_name, 'params')
-        self._system_info_group_name = os.path.join(self._trial_group_name, 'system_info')
-        self._time_dset_name = os.path.join(self._trial_group_name, 'time')
 
-        # Aggregators cannot use any of these already-used names
-        self._reserved_names = [
-            self._params_group_name,
-            self._system_info_group_name,
-            self._time_dset_name]
+        # Aggregators cannot use any of these already-used names (within the trial group)
+        self._reserved_names = ['params', 'system_info', 'time']
 
         self._set_trial()
 
         self._aggregators: Dict[str, Callable[[List[Robot]], np.ndarray]] = {}
 
+        # States are buffered in memory and written to the file every buffer_size steps
+        self._buffer_len = 0  # Number of states currently in the buffers
+        self._time_buffer = np.empty(buffer_size, dtype=np.int64)
+        # Buffer of [buffer_size, aggregator output size] for each aggregator
+        self._buffer: Dict[str, np.ndarray] = {}
+        # Whether each aggregator can write its output into a given array (``out`` argument)
+        self._agg_has_out: Dict[str, bool] = {}
+        # Per-robot arrays used by each aggregator (None if it uses the list of Robots)
+        self._agg_columns: Dict[str, Optional[List[str]]] = {}
+        # HDF5 Dataset for each aggregator
+        self._agg_dsets: Dict[str, h5py.Dataset] = {}
+
+        # Full buffers are written to the file by a background thread
+        # (This doesn't reference self, so the Logger can still be garbage collected)
+        self._write_queue: queue.Queue = queue.Queue(maxsize=2)
+        self._write_errors: List[Exception] = []
+        self._writer = threading.Thread(
+            target=_write_batches,
+            args=(self._write_queue, self._write_errors),
+            daemon=True)
+        self._writer.start()
+        self._is_closed = False
+        _open_loggers.add(self)
+
+    def __del__(self):
+        # Don't lose buffered data if the Logger is never explicitly closed
+        if not getattr(self, '_is_closed', True):
+            self.close()
+
     def _create_log_file(self, log_filename: str):
         # directory = os.path.abspath(os.path.expanduser(self.options.directory))
         full_path = Path(log_filename).expanduser().resolve()
@@ -125,7 +207,12 @@ class Logger:
         if not dir_path.is_dir():
             # Create the path to the save file if it doesn't exist
             dir_path.mkdir(parents=True, exist_ok=True)
-        log_file = h5py.File(log_filename, 'a')
+        # Append mode ('a') keeps any trials already saved in the file. The larger chunk cache
+        # (16 MB instead of 1 MB) holds a whole chunk of each time series Dataset while it's being
+        # filled.
+        # Chunks are only appended to (never read back), so fully-written chunks are evicted first
+        log_file = h5py.File(full_path, 'a', rdcc_nbytes=_CHUNK_CACHE_BYTES,
+                             rdcc_nslots=_CHUNK_CACHE_SLOTS, rdcc_w0=1.)
         return log_file
 
     def _set_trial(self):
@@ -154,16 +241,38 @@ class Logger:
             else:
                 raise ValueError(f'Conflicts with existing trial {self._trial_num}. '
                                  'Exiting to avoid data overwrite')
-        self._log_file.create_group(self._trial_group_name)
+        # (Keep the group handles, so they don't need to be looked up by name for every write)
+        self._trial_group = self._log_file.create_group(self._trial_group_name)
 
         # Create the params group, if it doesn't already exist
-        self._log_file.create_group(self._params_group_name)
+        self._params_group = self._trial_group.create_group('params')
 
         # Create a packet table dataset for the timeseries
         # http://docs.h5py.org/en/stable/faq.html#appending-data-to-a-dataset
-        self._log_file.create_dataset(self._time_dset_name,
-                                      shape=(0,),
-                                      maxshape=(None,), dtype='int')
+        # (Keep the Dataset handle, so it doesn't need to be looked up by name on every write)
+        self._time_dset = self._trial_group.create_dataset('time', shape=(0,),
+                                                           maxshape=(None,), dtype='int64',
+                                                           chunks=(self._chunk_rows(8),))
+
+    def _chunk_rows(self, row_bytes: int) -> int:
+        """
+        Get the number of states (rows) to store in each chunk of a time series Dataset.
+
+        Parameters
+        ----------
+        row_bytes : int
+            Size of a single state in the Dataset, in bytes
+
+        Returns
+        -------
+        int
+            Number of rows per chunk
+        """
+        if self._chunk_size is not None:
+            return self._chunk_size
+        # Largest power of two (so chunks stay aligned with the buffer) that fits in the limit
+        max_rows = max(1, _MAX_CHUNK_BYTES // row_bytes)
+        return min(self._buffer_size, 1 << (max_rows.bit_length() - 1))
 
     def get_trial(self) -> int:
         """
@@ -177,10 +286,12 @@ class Logger:
         return self._trial_num
 
     def add_aggregator(self, name: str,
-                       func: Callable[[List[Robot]], np.ndarray]):
+                       func: Callable[[List[Robot]], np.ndarray],
+                       columns: Optional[List[str]] = None,
+                       dtype: Optional[Union[str, np.dtype]] = None):
         """
         Add an aggregator function that will map from the list of all Robots in the world to a 1D
-        array of floats. This will be used for logging the state of the World; the output of the
+        numeric array. This will be used for logging the state of the World; the output of the
         aggregator is one row in the HDF5 Dataset named with the ``name``.
 
         The function reduces the state of the Robots to a single or multiple values. It could map to
@@ -191,11 +302,36 @@ class Logger:
         any parameters or functions that are called by the aggregator. The user is responsible for
         adding any necessary checks in the aggregator function.
 
+        The list of Robots given to the aggregator is the World's own list (see
+        :meth:`~gridsim.world.World.get_robot_list`), so the aggregator must not modify it.
+
+        The aggregator can optionally take an ``out`` keyword argument (``func(robots, out=None)``).
+        If it does, :meth:`~gridsim.logger.Logger.log_state` passes it a 1D array to write its
+        output into (and return), which avoids allocating a new array every step.
+
+        If the aggregator only needs the positions or colors of the Robots, give the names of the
+        arrays it needs as ``columns``. Then, instead of the list of Robots, ``func`` is given a
+        dictionary of arrays (one value per Robot, in the same order as
+        :meth:`~gridsim.world.World.get_robots`), which are read directly from the World instead of
+        from each Robot:
+
+        - ``x``: (N,) x positions
+        - ``y``: (N,) y positions
+        - ``pos``: (N, 2) (x, y) positions
+        - ``color``: (N, 3) (R, G, B) colors
+
+        For example, ``logger.add_aggregator('mean_x', lambda c: c['x'].mean(keepdims=True),
+        columns=['x'])``.
+
         Notes
         -----
-        The width of the aggregator table is set when this function is called, which is determined
-        by the length of the output of ``func``. If the length depends on the number of Robots, all
-        Robots should be added to the ``World`` *before* adding any aggregators to the ``Logger``.
+        The width and datatype of the aggregator table are set when this function is called, which
+        are determined by the output of ``func``. (For example, an aggregator that returns integers
+        is saved as integers.) If the length depends on the number of Robots, all Robots should be
+        added to the ``World`` *before* adding any aggregators to the ``Logger``.
+
+        To save the values with a smaller datatype (such as ``'float32'`` or ``'int16'``), which
+        makes log files smaller, give it as the ``dtype``.
 
         The aggregator ``func`` will be applied to all robots in the world, regardless of type.
         However, if you have multiple types of Robots in your ``World``, you can make an aggregator
@@ -208,59 +344,208 @@ class Logger:
         func : Callable[[List[Robot]], np.ndarray]
             Function that maps from a list of Robots to a 1D array to log some state of the Robots
             at the current time.
+        columns : List[str], optional
+            Names of the per-robot arrays (from ``Logger.COLUMNS``) to give to ``func`` instead of
+            the list of Robots. By default (``None``), ``func`` is given the list of Robots.
+        dtype : Union[str, np.dtype], optional
+            Numeric datatype with which to save the aggregator output (e.g., ``'float32'``). By
+            default (``None``), the datatype of the output of ``func`` is used.
+
         Raises
         ------
         ValueError
-            If aggregator ``name`` uses a reserved name (see above) or if aggregator does not return
-            a 1D numpy array.
+            If aggregator ``name`` uses a reserved name (see above), if aggregator does not return
+            a 1D numeric numpy array, or if any of the ``columns`` are not valid.
         """
         # Check that the name isn't an existing reserved group name (eg params)
         if name in self._reserved_names:
-            raise ValueError('Aggregator cannot use reserved name "{name}"')
-        # Add the function to the aggregators to be called for logging the state
-        self._aggregators[name] = func
+            raise ValueError(f'Aggregator cannot use reserved name "{name}"')
+        if columns is not None:
+            invalid = [c for c in columns if c not in Logger.COLUMNS]
+            if invalid:
+                raise ValueError(f'Invalid aggregator columns {invalid}. '
+                                 f'Columns must be in {Logger.COLUMNS}')
+            columns = list(columns)
+        # Write out anything already logged, so that all buffered states have the same aggregators
+        self._flush()
 
         # Do a test run of the aggregator to get the length of the output
-        test_output = func(self._world.get_robots().sprites())
-        out_size = test_output.size
-        # Should be 1D array (size is a single integer)
-        if not isinstance(out_size, int):
+        test_output = func(self._agg_input(columns, self._world.get_robot_list(),
+                                           self._get_columns()))
+        # (This is the only time the output shape is checked. After this, any output that doesn't
+        # fit in the aggregator's row of the buffer raises an error when it's copied there.)
+        if not isinstance(test_output, np.ndarray) or test_output.ndim != 1:
             raise ValueError(
                 f"Aggregator {name} must return a 1D array")
-        agg_dset_name = os.path.join(self._trial_group_name, name)
+        out_size = test_output.size
+        # Keep the aggregator's datatype, so values don't need to be converted when they're saved
+        dtype = test_output.dtype if dtype is None else np.dtype(dtype)
+        if dtype.kind not in 'biuf':
+            raise ValueError(f"Aggregator {name} must be saved as a numeric datatype (not {dtype})")
+        try:
+            has_out = 'out' in inspect.signature(func).parameters
+        except (ValueError, TypeError):
+            # Some callables (e.g., ones implemented in C) don't have a signature
+            has_out = False
+        # Add the function to the aggregators to be called for logging the state
+        self._aggregators[name] = func
+        self._agg_has_out[name] = has_out
+        self._agg_columns[name] = columns
+        self._buffer[name] = np.empty((self._buffer_size, out_size), dtype=dtype)
         # Setting the max_shape with None allows for resizing to add data
-        self._log_file.create_dataset(agg_dset_name,
-                                      shape=(0, out_size),
-                                      maxshape=(None, out_size),
-                                      dtype='float64')
+        # (Single values aren't worth compressing. Shuffling the bytes first groups the bytes of
+        # similar values together, which compresses better.)
+        compression = self._compression if out_size > 1 else None
+        chunks = (self._chunk_rows(dtype.itemsize * out_size), out_size)
+        self._agg_dsets[name] = self._trial_group.create_dataset(name,
+                                                                 shape=(0, out_size),
+                                                                 maxshape=(None, out_size),
+                                                                 dtype=dtype,
+                                                                 chunks=chunks,
+                                                                 compression=compression,
+                                                                 shuffle=compression is not None)
 
     def log_state(self):
         """
         Save the output of all of the aggregator functions. If you have not added any aggregators
-        with :meth:`~gridsim.logger.Logger.log_state`, nothing will be saved by this function.
+        with :meth:`~gridsim.logger.Logger.add_aggregator`, nothing will be saved by this function
+        (not even the time).
 
         The runs each previously-added aggregator function and appends the result to the respective
         HDF5 Dataset. It also saves the current time of the World to the ``time`` Dataset.
+
+        Results are buffered in memory and only written to the file once ``buffer_size`` states have
+        been logged, or when the Logger is closed with :meth:`~gridsim.logger.Logger.close`.
+
+        Raises
+        ------
+        ValueError
+            If the Logger is closed
         """
+        self._check_open()
+        if not self._aggregators:
+            return
         # Add the time
-        time = self._world.get_time()
-        self._log_file[self._time_dset_name].resize(
-            (self._log_file[self._time_dset_name].shape[0] + 1),
-            axis=0)
-        self._log_file[self._time_dset_name][-1:] = time
-
-        # Add the output of each aggregator function
-        robots = self._world.get_robots().sprites()
+        row = self._buffer_len
+        self._time_buffer[row] = self._world.get_time()
+
+        # Add the output of each aggregator function (directly into the buffer, if possible)
+        # (The robots and per-robot arrays are only gathered once, for all of the aggregators)
+        robots = self._world.get_robot_list()
+        columns = self._get_columns()
         for name, func in self._aggregators.items():
-            agg_vals = func(robots)
-            dset_name = os.path.join(self._trial_group_name, name)
-            self._log_file[dset_name].resize(
-                (self._log_file[dset_name].shape[0] + 1),
-                axis=0
-            )
-            self._log_file[dset_name][-1:] = agg_vals
-
-    def log_config(self, config: ConfigParser, exclude: List[str] = []):
+            agg_input = self._agg_input(self._agg_columns[name], robots, columns)
+            out = self._buffer[name][row]
+            if self._agg_has_out[name]:
+                agg_vals = func(agg_input, out=out)
+                if agg_vals is not out:
+                    out[:] = agg_vals
+            else:
+                out[:] = func(agg_input)
+        self._buffer_len += 1
+
+        if self._buffer_len >= self._buffer_size:
+            self._flush()
+
+    def _get_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get all of the per-robot arrays that aggregators can use (see ``Logger.COLUMNS``). These
+        are views of the World's arrays, so this is cheap.
+
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            Array for each column name
+        """
+        pos = self._world.get_positions()
+        return {'x': pos[:, 0], 'y': pos[:, 1], 'pos': pos, 'color': self._world.get_colors()}
+
+    @staticmethod
+    def _agg_input(agg_columns: Optional[List[str]], robots: List[Robot],
+                   columns: Dict[str, np.ndarray]) -> Union[List[Robot], Dict[str, np.ndarray]]:
+        # Input for an aggregator: the list of robots, or the per-robot arrays it asked for
+        if agg_columns is None:
+            return robots
+        return {c: columns[c] for c in agg_columns}
+
+    def _flush(self):
+        """
+        Send all of the buffered states to the background thread to be written to the HDF5 file
+        (with one resize and write per Dataset), and start new buffers.
+
+        Raises
+        ------
+        ValueError
+            If the Logger is closed
+        RuntimeError
+            If writing a previous batch of data to the file failed
+        """
+        self._check_open()
+        self._check_write_errors()
+        n = self._buffer_len
+        if n == 0:
+            return
+        batch = [(self._time_dset, self._time_buffer[:n])]
+        batch += [(self._agg_dsets[name], buf[:n]) for name, buf in self._buffer.items()]
+        self._write_queue.put(batch)
+
+        # The writer thread now owns the old buffers, so fill new ones
+        self._time_buffer = np.empty_like(self._time_buffer)
+        self._buffer = {name: np.empty_like(buf) for name, buf in self._buffer.items()}
+        self._buffer_len = 0
+
+    def flush(self):
+        """
+        Write all of the buffered states to the HDF5 file, and wait until they have been written.
+        You don't need to call this at the end of a trial (:meth:`~gridsim.logger.Logger.close`
+        does this), but you can use it to make sure that the file is up to date while the
+        simulation is running.
+
+        Raises
+        ------
+        ValueError
+            If the Logger is closed
+        RuntimeError
+            If writing the logged data to the file failed
+        """
+        self._flush()
+        self._write_queue.join()
+        self._log_file.flush()
+        self._check_write_errors()
+
+    def _check_open(self):
+        # The writer thread and file are gone once the Logger is closed, so nothing can be logged
+        if self._is_closed:
+            raise ValueError('Logger is closed')
+
+    def _check_write_errors(self):
+        # Raise any error from the background writer thread in the main thread
+        if self._write_errors:
+            raise RuntimeError('Failed to write logged data to file') from self._write_errors[0]
+
+    def close(self):
+        """
+        Write any buffered states to the file and close it. Call this when you are done logging a
+        trial; the Logger can't be used after it is closed.
+
+        Raises
+        ------
+        RuntimeError
+            If writing the logged data to the file failed
+        """
+        if not self._is_closed:
+            _open_loggers.discard(self)
+            try:
+                self._flush()
+            finally:
+                self._is_closed = True
+                # Tell the writer thread to stop, and wait for it to finish writing
+                self._write_queue.put(None)
+                self._writer.join()
+                self._log_file.close()
+            self._check_write_errors()
+
+    def log_config(self, config: ConfigParser, exclude: Union[str, List[str]] = []):
         """
         Save all of the parameters in the configuration.
 
@@ -274,26 +559,27 @@ class Logger:
         - float
         - boolean
         - list of integers and/or floats
+        - numpy array or value of integers, floats, or booleans
 
         Parameters
         ----------
         config : ConfigParser
             Configuration loaded from a YAML file.
-        exclude : List[str], optional
-            Names (keys) of any configuration parameters to exclude from the saved parameters. This
-            can be useful for excluding an array of values that vary by condition, and you want to
-            only include the single value used in this instance.
+        exclude : Union[str, List[str]], optional
+            Name(s) (keys) of any configuration parameters to exclude from the saved parameters.
+            This can be useful for excluding an array of values that vary by condition, and you want
+            to only include the single value used in this instance.
         """
-        params = config.get()
-
-        for name, val in params.items():
-            self.log_param(name, val)
+        # (A single name is one parameter, not a collection of characters)
+        exclude = {exclude} if isinstance(exclude, str) else set(exclude)
+        self.log_params({name: val for name, val in config.get().items() if name not in exclude})
 
     def log_param(self, param_name: str, val: PARAM_TYPE, sub_group: Optional[str] = None):
         """
         Save a single parameter value. This is useful for saving fixed parameters that are not part
         of your configuration file, and therefore not saved with
-        :meth:`~gridsim.logger.Logger.log_config`.
+        :meth:`~gridsim.logger.Logger.log_config`. To save many parameters, use
+        :meth:`~gridsim.logger.Logger.log_params`.
 
         This has the same type restrictions for values as :meth:`~gridsim.logger.Logger.log_config`.
 
@@ -308,37 +594,86 @@ class Logger:
             the parameter will be placed directly in the params group. You can specify multiple
             levels of sub-groups by concatenating names with ``/``. e.g., ``sub/subsub``
 
+        Warns
+        -----
+        UserWarning
+            If user attempts to save invalid parameter (e.g., invalid data type)
+        """
+        self.log_params({param_name: val}, sub_group=sub_group)
+
+    def log_params(self, params: Dict[str, PARAM_TYPE], sub_group: Optional[str] = None):
+        """
+        Save many parameter values at once (like calling :meth:`~gridsim.logger.Logger.log_param`
+        for each of them). Each parameter is still saved as its own Dataset, but this only looks up
+        the group to save them in once.
+
+        This has the same type restrictions for values as :meth:`~gridsim.logger.Logger.log_config`.
+
+        Parameters
+        ----------
+        params : Dict[str, Union[str, int, float, bool, list, dict]]
+            Names/keys and values of the parameters to save
+        sub_group : str
+            Name of a sub-group of the "params" group in which to log the parameters (as in
+            :meth:`~gridsim.logger.Logger.log_param`)
+
         Warns
         -----
         UserWarning
             If user attempts to save invalid parameter (e.g., invalid data type)
         """
         if sub_group is not None:
-            name = os.path.join(sub_group, param_name)
+            group = self._params_group.require_group(sub_group)
+            prefix = f"{sub_group}/"
         else:
-            name = param_name
-        dset_name = os.path.join(self._params_group_name, name)
+            group = self._params_group
+            prefix = ''
+        for param_name, val in params.items():
+            self._write_param(group, param_name, val, prefix)
+
+    def _write_param(self, group: h5py.Group, param_name: str, val: PARAM_TYPE, prefix: str):
+        """
+        Save a single parameter value as a Dataset in the given group (or a group, for dictionaries)
+
+        Parameters
+        ----------
+        group : h5py.Group
+            Group in which to save the parameter
+        param_name : str
+            Name/key of the parameter value to save
+        val : Union[str, int, float, bool, list, dict]
+            Value of the parameter to save
+        prefix : str
+            Path of the group within the params group (for warnings)
+        """
+        name = prefix + param_name
         v_type = type(val)
 
         if isinstance(val, dict):
             # Saving a dictionary means creating a group instead of dataset
+            sub_group = group.require_group(param_name)
             for d_key, d_val in val.items():
-                self.log_param(d_key, d_val, sub_group=name)
+                self._write_param(sub_group, d_key, d_val, f"{name}/")
             return
-        if isinstance(val, list):
-            # Check that it's a list of floats or ints
-            all_valid = all([isinstance(v, (int, float)) for v in val])
-            if not all_valid:
+        if isinstance(val, (list, np.ndarray, np.number, np.bool_)):
+            # Lists (and numpy values) must be numeric. Save them with their numpy datatype
+            try:
+                val = np.asarray(val)
+            except ValueError:  # e.g., lists of lists with different lengths
+                val = np.asarray(None)
+            if val.dtype.kind not in 'biuf':
                 warnings.warn('Can only save lists of ints and floats. '
                               f'Skipping parameter "{name}"')
                 return
-        try:
-            dtype = Logger.DATATYPE_MAP[v_type]
-        except KeyError:
-            warnings.warn(f'Cannot save {Logger.type_str(v_type)} data. '
-                          'fSkipping parameter "{param_name}"')
-            return
-        self._log_file.create_dataset(dset_name, data=val, dtype=dtype)
+            dtype = val.dtype
+        else:
+            try:
+                dtype = Logger.DATATYPE_MAP[v_type]
+            except KeyError:
+                warnings.warn(f'Cannot save {Logger.type_str(v_type)} data. '
+                              f'Skipping parameter "{name}"')
+                return
+        group.create_dataset(param_name, data=val, dtype=dtype)
 
     def log_system_info(self):
         """
@@ -353,16 +688,89 @@ class Logger:
         - ``gridsim_version``: Currently installed Gridsim version
         - ``datetime_local``: Local date and time when trial was run
         """
-        sys_info = {
-            'system': platform.system(),
-            'node': platform.node(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'python_version': platform.python_version(),
-            'gridsim_version': get_version(),
-            'datetime_local': str(datetime.now()),
-        }
+        sys_info = dict(_system_info(), datetime_local=str(datetime.now()))
 
+        group = self._trial_group.require_group('system_info')
         for key, val in sys_info.items():
-            dset_name = os.path.join(self._system_info_group_name, key)
-            self._log_file.create_dataset(dset_name, data=val)
+            group.create_dataset(key, data=val)
+
+
+@functools.lru_cache(maxsize=None)
+def _system_info() -> Dict[str, str]:
+    """
+    Get the system information saved by :meth:`~gridsim.logger.Logger.log_system_info` (except for
+    the time). This doesn't change while Python is running, so it's only looked up once.
+
+    Returns
+    -------
+    Dict[str, str]
+        System information, by name
+    """
+    return {
+        'system': platform.system(),
+        'node': platform.node(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'python_version': platform.python_version(),
+        'gridsim_version': get_version(),
+    }
+
+
+def _write_batches(write_queue: queue.Queue, errors: List[Exception]):
+    """
+    Write batches of logged states to the log file, until ``None`` is received. This runs in the
+    Logger's background thread.
+
+    Parameters
+    ----------
+    write_queue : queue.Queue
+        Queue of batches to write. Each batch is a list of (Dataset, rows to append).
+    errors : List[Exception]
+        Any errors that occur while writing are added to this list (and the batch is skipped)
+    """
+    while True:
+        batch = write_queue.get()
+        try:
+            if batch is None:
+                return
+            for dset, data in batch:
+                _append(dset, data)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            write_queue.task_done()
+
+
+def _append(dset: h5py.Dataset, data: np.ndarray):
+    """
+    Append rows to the end of a resizable Dataset.
+
+    Rows that exactly fill one of the Dataset's (uncompressed) chunks are written as a raw chunk,
+    which skips h5py's selection and type conversion. Any other rows are written normally.
+
+    Parameters
+    ----------
+    dset : h5py.Dataset
+        Dataset to add to, which can be resized along the first axis
+    data : np.ndarray
+        Rows to append to the Dataset
+    """
+    old_len = dset.shape[0]
+    n = data.shape[0]
+    dset.resize(old_len + n, axis=0)
+    chunk_rows = dset.chunks[0]
+    if dset.chunks[1:] == data.shape[1:] and data.dtype == dset.dtype and \
+            dset.compression is None and not dset.shuffle and data.flags.c_contiguous:
+        # Rows before the start of the next chunk can't be written as a whole chunk
+        start = min(n, -old_len % chunk_rows)
+    else:
+        start = n
+    if start > 0:
+        dset[old_len:old_len + start] = data[:start]
+    zeros = (0,) * (data.ndim - 1)
+    while n - start >= chunk_rows:
+        dset.id.write_direct_chunk((old_len + start,) + zeros,
+                                   data[start:start + chunk_rows].tobytes())
+        start += chunk_rows
+    if start < n:
+        dset[old_len + start:] = data[start:]
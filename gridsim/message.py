@@ -11,13 +11,29 @@ If no arguments are provided when a Message is created, it creates a null messag
 that the robot is not broadcasting anything.
 
 While it is possible to extend this class, the default Message class should meet most needs.
+
+A robot's message is broadcast continuously until it is changed, so you don't need to create a new
+Message every step; create it once and only change it when the contents change. Every receiving
+robot gets the *same* Message object, so treat received messages as read-only.
 """
 
 from typing import Dict, Any, Optional, Type  # , TYPE_CHECKING
+import functools
+import types
 
 from .robot import Robot
 
 
+# Contents of every null Message (read-only, so it can be shared)
+_EMPTY = types.MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=None)
+def _is_robot_type(rx_type: type) -> bool:
+    # Checking the receiver type is cached, since the same few types are used for every Message
+    return isinstance(rx_type, type) and issubclass(rx_type, Robot)
+
+
 class Message:
     """A message sent by robots
 
@@ -30,7 +46,7 @@ class Message:
     tx_id : int, optional
         ID of the sending (transmitting) robot, by default None
     content : Dict[str, Any]], optional
-        Dictionary of message keys and values, by default an empty dictionary. Keys must be
+        Dictionary of message keys and values, by default None (an empty dictionary). Keys must be
         strings, but values can be of any type (incumbent on receiver to correctly interpret
         incoming data).
     rx_type : Type[Robot], optional
@@ -44,8 +60,11 @@ class Message:
         a dictionary with strings for keys
     """
 
+    # Robots may create a lot of Messages, so they're stored in slots instead of a dictionary
+    __slots__ = ('_tx_id', '_rx_type', '_content', '_is_null')
+
     def __init__(self, tx_id: Optional[int] = None,
-                 content: Dict[str, Any] = {},
+                 content: Optional[Dict[str, Any]] = None,
                  rx_type: Type[Robot] = Robot,  # Default is any robot
                  ):
         # Validate the message contents
@@ -53,21 +72,25 @@ class Message:
             # Null message
             self._tx_id = None
             self._rx_type = None
-            self._content = {}
+            self._content = _EMPTY
             self._is_null = True
         else:
             # Non-null message must include correct receiver type and dictionary
-            if not issubclass(rx_type, Robot):
+            if content is None:
+                content = {}
+            if not _is_robot_type(rx_type):
                 raise TypeError('Receiver type must be a subclass of Robot')
-            if not isinstance(content, Dict) or \
-                    not all(map(lambda k: isinstance(k, str), content.keys())):
+            if not isinstance(content, dict):
                 raise TypeError(
                     'Content must be a dictionary with string keys')
-            else:
-                self._tx_id = tx_id
-                self._rx_type = rx_type
-                self._content = content
-                self._is_null = False
+            for key in content:
+                if not isinstance(key, str):
+                    raise TypeError(
+                        'Content must be a dictionary with string keys')
+            self._tx_id = tx_id
+            self._rx_type = rx_type
+            self._content = content
+            self._is_null = False
 
     def get(self, key: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get the contents of the message
@@ -81,7 +104,8 @@ class Message:
         Returns
         -------
         Dict[str, Any] or None
-            Dictionary of the message contents
+            Dictionary of the message contents. (For a null message, this is an empty read-only
+            dictionary.)
 
         Raises
         ------
@@ -142,7 +166,7 @@ class Message:
             self._content = content
 
     def sender(self) -> Optional[int]:
-        """Get the ID (32-bit integer) of the robot that sent the message
+        """Get the ID (integer) of the robot that sent the message
 
         Returns
         -------
@@ -167,3 +191,7 @@ class Message:
             return "NULL message"
         else:
             return f'{self._tx_id} -> {self._rx_type}: {self._content}'
+
+
+# Null message shared by all Robots that haven't set a message (null messages can't be changed)
+_NULL_MESSAGE = Message()
@@ -2,7 +2,9 @@ from __future__ import annotations  # For the type checking circular import
 
 from abc import ABC, abstractmethod
 from typing import Tuple, TYPE_CHECKING, Optional
-import random
+import functools
+import itertools
+import math
 
 import numpy as np
 import pygame
@@ -13,6 +15,38 @@ from .environment import Environment
 if TYPE_CHECKING:
     from .message import Message
 
+# Source of unique Robot IDs (counts up from 0 as Robots are created)
+_robot_ids = itertools.count()
+
+
+@functools.lru_cache(maxsize=1024)
+def _robot_surface(cell_size: float, color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Get the image of a Robot (a circle filling the cell) to draw in the Viewer. Robots of the same
+    size and color share the same image, so each circle is only drawn once.
+
+    Parameters
+    ----------
+    cell_size : float
+        Side length of square cells in pixels
+    color : Tuple[int, int, int]
+        RGB color of the Robot
+
+    Returns
+    -------
+    pygame.Surface
+        Image of the Robot. This is shared, so don't draw on it.
+    """
+    image = pygame.Surface([cell_size, cell_size], pygame.SRCALPHA)
+    radius = int(cell_size/2)
+    pygame.draw.circle(image, color, (radius, radius), radius)
+    if pygame.display.get_surface() is not None:
+        # Match the pixel format of the window, which makes drawing (blitting) it faster
+        # (The Viewer clears the cache when it creates the window, so images made before that are
+        # made again)
+        image = image.convert_alpha()
+    return image
+
 
 class Robot(ABC, pygame.sprite.Sprite):
     """Abstract base class for all robot classes
@@ -25,19 +59,24 @@ class Robot(ABC, pygame.sprite.Sprite):
         Starting y position (grid cell) of the robot
     """
 
+    # Fixed attributes of every Robot are stored in slots (faster to access than the instance
+    # dictionary). Subclasses can still add their own attributes as usual.
+    __slots__ = ('id', '_start_pos', '_cell_size', '_color', '_arena_dim', '_tick', '_tx_message',
+                 '_is_in_world', 'is_sprite_setup', '_environment', '_world', '_idx')
+
     def __init__(self, x: int, y: int):
         pygame.sprite.Sprite.__init__(self)  # call Sprite initializer
 
         #: Unique ID of the Robot
-        self.id: int = random.getrandbits(32)  # Random 32-bit integer
-        self._x = x
-        self._y = y
+        self.id: int = next(_robot_ids)
+        # Once the Robot is in a World, its position is stored by the World (see get_pos)
+        self._start_pos = (x, y)
         self._cell_size = 0.  # set in sprite_setup (when added to world)
         self._color = (255, 255, 255)
         self._arena_dim = (0, 0)
         self._tick = 0
-        from .message import Message  # Here to fix circular import
-        self._tx_message = Message()  # Start with a null/blank message
+        from .message import _NULL_MESSAGE  # Here to fix circular import
+        self._tx_message = _NULL_MESSAGE  # Start with a null/blank message
 
         self._is_in_world = False
         self.is_sprite_setup = False
@@ -46,7 +85,7 @@ class Robot(ABC, pygame.sprite.Sprite):
         self._environment: Environment = Environment()
 
     def add_to_world(self, arena_width: int, arena_height: int,
-                     world=None):
+                     world=None, idx: int = 0):
         """
         Add a robot to the world by telling it the world's dimensions
 
@@ -58,6 +97,8 @@ class Robot(ABC, pygame.sprite.Sprite):
             Grid height of the arena
         world: World
             World that this Robot is being added to
+        idx : int
+            Index (row) of this Robot in the World's per-robot arrays
 
         Raises
         ------
@@ -66,16 +107,20 @@ class Robot(ABC, pygame.sprite.Sprite):
         """
         # Tell the robot the size of the world
         self._arena_dim = (arena_width, arena_height)
-        self._is_in_world = True
 
         # Robots must start within the World
-        if not self._is_in_bounds():
+        x, y = self._start_pos
+        if not (0 <= x < arena_width and 0 <= y < arena_height):
             raise ValueError("Robot created outside the dimensions "
-                             f"of the World's grid at ({self._x}, {self._y}).")
+                             f"of the World's grid at ({x}, {y}).")
 
         # Add the World's environment, if it has one
         self._environment = world.get_environment()
         self._world = world
+        self._idx = idx
+        world._pos[idx] = self._start_pos
+        world._colors[idx] = self._color
+        self._is_in_world = True
 
         # Robot-specific initialization
         # (only called once a robot is placed in the world)
@@ -129,33 +174,23 @@ class Robot(ABC, pygame.sprite.Sprite):
             Side length of square cells in pixels, for determining size to draw the Robot.
         """
         self._cell_size = cell_size
-        self.image = pygame.Surface([cell_size, cell_size], pygame.SRCALPHA)
-        radius = int(cell_size/2)
-        pygame.draw.circle(self.image, self._color,
-                           (int(cell_size/2), int(cell_size/2)), radius)
+        self.image = _robot_surface(cell_size, self._color)
 
         self.rect = self.image.get_rect()
-        self.rect.topleft = (self._x*cell_size, self._y*cell_size)
+        x, y = self.get_pos()
+        self.rect.topleft = (x*cell_size, y*cell_size)
         self.is_sprite_setup = True
 
     def update(self):
         """
-        Run the robot's controller, move the robot, and (if Viewer is being
-        used), update the Sprite information.
+        Run the robot's controller and move the robot.
 
         This operates in the order: controller -> move. This means operations
         will occur at the starting position, THEN the robot will move.
 
         (The update() function comes from the Sprite class.)
         """
-
-        # Run the robot's loop function (includes setting move commands)
-        self._controller()
-
-        # Update position/color for viewer
-        if self.is_sprite_setup:
-            self.rect.topleft = (self._x*self._cell_size,
-                                 self._y*self._cell_size)
+        self._update_controller()
 
         # Call the platform-specific movement operation
         new_pos = self.move()
@@ -164,6 +199,15 @@ class Robot(ABC, pygame.sprite.Sprite):
 
         self._tick += 1
 
+    def _update_controller(self):
+        """
+        Run the controller part of :meth:`~gridsim.robot.Robot.update`, without moving the robot or
+        advancing its tick. (This lets the World move many robots at once.)
+        """
+        # Run the robot's loop function (includes setting move commands)
+        # (The Viewer updates the Sprite's position when it draws the Robot)
+        self._controller()
+
     def _move(self, new_pos: Tuple[int, int]):
         """
         Actually (possibly) move the robot, subject to constraints. Robot will
@@ -174,11 +218,12 @@ class Robot(ABC, pygame.sprite.Sprite):
         # TODO: Move the robot (possibly dealing with collisions?)
         # Only move if you'll stay in the arena
         # Currently this ignores between-robot collisions
-        if new_pos[0] < self._arena_dim[0] and \
-           new_pos[1] < self._arena_dim[1] and \
-           new_pos[0] >= 0 and new_pos[1] >= 0:
-            self._x = new_pos[0]
-            self._y = new_pos[1]
+        # (Robots with a custom move() can jump more than one cell, so they aren't clamped to the
+        # edge of the arena like GridRobots moved by the World)
+        x, y = new_pos
+        width, height = self._arena_dim
+        if 0 <= x < width and 0 <= y < height:
+            self._world._pos[self._idx] = new_pos
 
     def set_color(self, r: int, g: int, b: int):
         """
@@ -200,16 +245,15 @@ class Robot(ABC, pygame.sprite.Sprite):
         """
         # Set the RGB color (0-255 for RGB channels)
         color = (r, g, b)
-        if all([0 <= c <= 255 for c in color]):
+        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
             self._color = color
+            if self._is_in_world:
+                self._world._colors[self._idx] = color
         else:
             raise ValueError('RGB values must all be in the range [0, 255]')
 
         if self.is_sprite_setup:
-            pygame.draw.circle(
-                self.image, self._color,
-                (int(self._cell_size/2), int(self._cell_size/2)),  # x, y pos
-                int(self._cell_size/2))  # radius
+            self.image = _robot_surface(self._cell_size, self._color)
 
     def get_pos(self) -> Tuple[int, int]:
         """
@@ -220,7 +264,10 @@ class Robot(ABC, pygame.sprite.Sprite):
         Tuple[int, int]
             (x, y) grid position of the robot, from the top left
         """
-        return self._x, self._y
+        if self._is_in_world:
+            x, y = self._world._pos[self._idx].tolist()
+            return x, y
+        return self._start_pos
 
     def get_tick(self) -> int:
         """
@@ -305,8 +352,9 @@ class Robot(ABC, pygame.sprite.Sprite):
             Euclidean distance of this robot from the given coordinate
         """
         # TODO: Move to abstract/subclass to allow customized distance metric?
-        # return np.abs(self._x - pos[0]) + np.abs(self._y - pos[1])# Manhattan
-        return np.sqrt((self._x - pos[0])**2+(self._y-pos[1])**2)
+        x, y = self.get_pos()
+        # return np.abs(x - pos[0]) + np.abs(y - pos[1])# Manhattan
+        return math.hypot(x - pos[0], y - pos[1])
 
     def _distance_sqr(self, pos: Tuple[int, int]) -> int:
         """
@@ -325,12 +373,14 @@ class Robot(ABC, pygame.sprite.Sprite):
         int
             Distance squared -- (x0-x1)^2 + (y0-y1)^2
         """
-        return (self._x - pos[0])**2 + (self._y-pos[1])**2
+        x, y = self.get_pos()
+        return (x - pos[0])**2 + (y-pos[1])**2
 
     def _is_in_bounds(self) -> bool:
         # Check if the Robot is within the world boundaries
-        return 0 <= self._x < self._arena_dim[0] and \
-            0 <= self._y < self._arena_dim[1]
+        x, y = self.get_pos()
+        return 0 <= x < self._arena_dim[0] and \
+            0 <= y < self._arena_dim[1]
 
     @abstractmethod
     def move(self) -> Tuple[int, int]:
@@ -394,6 +444,46 @@ class Robot(ABC, pygame.sprite.Sprite):
         """
         pass
 
+    def comm_mask(self, dist_sqr: np.ndarray) -> np.ndarray:
+        """
+        Check :meth:`~gridsim.robot.Robot.comm_criteria` for many other robots at once. The World
+        uses this to find all of the robots that can receive this robot's message.
+
+        By default, this calls :meth:`~gridsim.robot.Robot.comm_criteria` for each distance. If
+        your communication criterion can be written with numpy operations, you can override this to
+        make communication faster (it must match ``comm_criteria``).
+
+        Parameters
+        ----------
+        dist_sqr : np.ndarray
+            1D array of SQUARED distances between this robot and other robots
+
+        Returns
+        -------
+        np.ndarray
+            1D boolean array of whether each of the other robots is within communication range
+        """
+        return np.array([self.comm_criteria(d) for d in dist_sqr.tolist()], dtype=bool)
+
+    def get_comm_range(self) -> Optional[float]:
+        """
+        Get the maximum distance (in grid cells) at which this robot can communicate. The World uses
+        this to skip robots that are too far away to communicate, without calling
+        :meth:`~gridsim.robot.Robot.comm_criteria` for them.
+
+        By default, this returns ``None`` (unknown range), which means that
+        :meth:`~gridsim.robot.Robot.comm_criteria` is checked for every other robot in the World.
+        If your ``comm_criteria`` has a maximum range, override this to return it; this can make
+        simulations with many robots much faster.
+
+        Returns
+        -------
+        float or None
+            Communication range of this robot, beyond which
+            :meth:`~gridsim.robot.Robot.comm_criteria` is always False, or ``None`` if unknown
+        """
+        return None
+
     @abstractmethod
     def receive_msg(self, msg: Message, dist_sqr: float):
         """
@@ -6,16 +6,18 @@ World.
 .. note::
    The maximum Viewer refresh rate (set at creation with the ``display_rate`` argument) also limits
    the simulation rate. If you want to run faster/higher-throughput simulations, don't use the
-   Viewer, or make it draw less frequently than every tick.
+   Viewer, or make it draw less frequently than every tick (with the ``draw_every`` argument). You
+   can also create it with ``enabled=False`` to turn off drawing without changing the rest of your
+   code.
 """
 
 import os
 import math
 
 import pygame
-from PIL import Image
 
 from .world import World
+from .robot import _robot_surface
 
 
 class Viewer:
@@ -41,13 +43,26 @@ class Viewer:
     show_time : bool, optional
         Whether to draw the time (ticks) as text within the viewer window, by default False. (It is
         placed in the upper right corner.)
+    draw_every : int, optional
+        Only draw the World every ``draw_every`` ticks, by default 1 (draw every tick). Calls to
+        :meth:`~gridsim.viewer.Viewer.draw` at other times return immediately.
+    enabled : bool, optional
+        Whether to display anything at all, by default True. If False, no window is created and
+        :meth:`~gridsim.viewer.Viewer.draw` does nothing. This is useful for running simulations
+        without the Viewer, without changing the code.
     """
 
     def __init__(self, world: World, window_width: int = 1080, display_rate: int = 10,
                  show_grid: bool = False, show_network: bool = False,
-                 show_time: bool = False):
+                 show_time: bool = False, draw_every: int = 1, enabled: bool = True):
 
         self._world = world
+        self._draw_every = max(1, int(draw_every))
+        if not enabled:
+            # Skip all of the pygame setup, and never draw anything
+            self.draw = lambda: None
+            return
+
         self._clock = pygame.time.Clock()
         self._tick_rate = display_rate
         self._show_grid = show_grid
@@ -71,6 +86,9 @@ class Viewer:
         self._has_screen = bool(os.getenv('HAS_SCREEN', True))
         if self._has_screen:
             self._screen = pygame.display.set_mode(self._window_dim)
+            # Robot images made before there was a window can't match its pixel format, so make
+            # them again (see _robot_surface)
+            _robot_surface.cache_clear()
 
         # Set up all of the sprites for all of the robots
         [r._sprite_setup(self._cell_size) for r in self._world.get_robots()]
@@ -106,10 +124,8 @@ class Viewer:
         # Decrease opacity
         tagged_pos[:, :, 3] = tagged_pos[:, :, 3] * .25
         tag_dims = tagged_pos.shape
-        pil_img = Image.fromarray(tagged_pos, mode='RGBA')
-        # Convert to Pygame image
-        raw_str = pil_img.tobytes('raw', 'RGBA')
-        img = pygame.image.fromstring(raw_str, (tag_dims[1], tag_dims[0]), 'RGBA')
+        # Convert to Pygame image (directly from the array's memory)
+        img = pygame.image.frombuffer(tagged_pos, (tag_dims[1], tag_dims[0]), 'RGBA')
         # Resize to match the viewer window
         img = pygame.transform.scale(img, self._window_dim)
         # Draw it
@@ -134,6 +150,9 @@ class Viewer:
         This will also draw the World's environment (if one is set) and any tagged cells in the
         World.
         """
+        if self._world.get_time() % self._draw_every:
+            # Not time to draw yet
+            return
         if self._has_screen:
             time_text = str(self._world.get_time())
             # Set the window title
@@ -142,6 +161,15 @@ class Viewer:
 
             # If the world has a new environment, change the viewer background
             self._update_bg()
+            # Move the robot Sprites to the robots' current positions (all at once, and only when
+            # drawing, instead of every step)
+            sprites = self._world.get_robot_list()
+            positions = (self._world.get_positions() * self._cell_size).tolist()
+            for spr, topleft in zip(sprites, positions):
+                if not spr.is_sprite_setup:
+                    spr._sprite_setup(self._cell_size)
+                spr.rect.topleft = topleft
+
             # Clear everything by drawing the background
             self._screen.blit(self._bg, (0, 0))
             self._draw_tagged_cells()
@@ -158,11 +186,8 @@ class Viewer:
             # Draw all the robots
             # Overrides sprite.Group.draw() method (see pygame source code)
             robots = self._world.get_robots()
-            sprites = robots.sprites()
             # robots.draw(self._screen)
             for spr in sprites:
-                if not spr.is_sprite_setup:
-                    spr._sprite_setup(self._cell_size)
                 robots.spritedict[spr] = self._screen.blit(spr.image, spr.rect)
             self.lostsprites = []
 
@@ -8,14 +8,21 @@ Once the World is created and you have added your robots, you will likely only n
 :meth:`~gridsim.world.World.step` method.
 """
 
-from typing import Tuple, List, Optional, Dict
+from typing import Tuple, List, Optional
+import functools
+import math
 
 import pygame
 import numpy as np
 
 from .robot import Robot
+from .grid_robot import GridRobot
 from .environment import Environment, ImageEnvironment
 
+# With fewer robots than this, communication checks all pairs of robots instead of sorting them into
+# buckets (because building the buckets costs more than it saves)
+_MIN_ROBOTS_TO_BUCKET = 32
+
 
 class World:
     """A simulated 2D grid world for simulated Robots.
@@ -53,12 +60,24 @@ class World:
         self._grid_width = width
         self._grid_height = height
         self._robots = pygame.sprite.Group()
+        # The same Robots as a list (in the order they were added), so it doesn't need to be rebuilt
+        # from the Group every step
+        self._robot_list: List[Robot] = []
 
         self._allow_collisions = allow_collisions
         self._tick = 0
 
         self._observation_stdev = observation_stdev
 
+        # Per-robot state stored as arrays (one row per Robot, in the order they were added), so it
+        # can be read for all Robots at once. These grow as Robots are added.
+        # (x, y) position of each robot
+        self._pos = np.zeros([0, 2], dtype=np.int32)
+        # RGB color of each robot
+        self._colors = np.zeros([0, 3], dtype=np.uint8)
+        # Movement direction of each GridRobot (e.g., GridRobot.UP)
+        self._move_cmds = np.zeros([0], dtype=np.uint8)
+
         # 3D array of [width, height, RGBA] to tag positions with colors
         # Alpha channel indicates whether cell is tagged or not.
         # alpha = 255 is tagged
@@ -77,13 +96,33 @@ class World:
         # lines between robots to visualize the communication network
         self._viewer_comm_edges: List[Tuple[pygame.sprite.Sprite]] = []
 
+        # Robots sorted into buckets for communication, kept between steps (see _sort_buckets)
+        self._bucket_size = 0
+        self._bucket_cells = np.zeros([0, 2], dtype=np.int64)
+        self._bucket_key_width = 0
+        self._bucket_order = np.zeros([0], dtype=np.intp)
+        self._bucket_keys = np.zeros([0], dtype=np.int64)
+
     def step(self):
         """
         Run a single step of the simulation. This moves the robots, manages the clock, and runs the
         robot controllers.
-        """
 
-        self._robots.update()
+        GridRobots that use the default :meth:`~gridsim.grid_robot.GridRobot.move` are moved all at
+        once, after all of the robot controllers have run.
+        """
+        batch_robots = []
+        for r in self._robot_list:
+            if _uses_batch_move(type(r)):
+                r._update_controller()
+                batch_robots.append(r)
+            else:
+                r.update()
+        if batch_robots:
+            self._batch_move(batch_robots)
+            # Like Robot.update, the tick only advances after the robot has moved
+            for r in batch_robots:
+                r._tick += 1
         self._communicate()
         self._tick += 1
 
@@ -97,8 +136,41 @@ class World:
         robot : Robot
             Robot to add to the World
         """
+        if robot in self._robots:
+            return
+        # Reserve a row for this Robot in the per-robot arrays
+        idx = len(self._robots)
+        if idx == self._colors.shape[0]:
+            self._pos = _grow(self._pos)
+            self._colors = _grow(self._colors)
+            self._move_cmds = _grow(self._move_cmds)
         self._robots.add(robot)
-        robot.add_to_world(self._grid_width, self._grid_height, world=self)
+        self._robot_list.append(robot)
+        robot.add_to_world(self._grid_width, self._grid_height, world=self, idx=idx)
+
+    def _batch_move(self, robots: List[GridRobot]):
+        """
+        Move GridRobots in their set directions, all at once. Like
+        :meth:`~gridsim.robot.Robot._move`, a robot only moves if it will stay in the World.
+
+        Parameters
+        ----------
+        robots : List[GridRobot]
+            GridRobots to move
+        """
+        # GridRobots only move along one axis, so clamping each coordinate to the World is the same
+        # as not moving robots that would leave the World
+        max_pos = (self._grid_width - 1, self._grid_height - 1)
+        num_robots = len(robots)
+        if num_robots == len(self._robots):
+            # All of the robots are moving, so update their positions in place
+            pos = self._pos[:num_robots]
+            pos += GridRobot.DIR_DELTAS[self._move_cmds[:num_robots]]
+            np.clip(pos, 0, max_pos, out=pos)
+        else:
+            inds = np.fromiter((r._idx for r in robots), dtype=np.intp, count=num_robots)
+            new_pos = GridRobot.batch_move(self._pos[inds], self._move_cmds[inds])
+            self._pos[inds] = np.clip(new_pos, 0, max_pos)
 
     def add_environment(self, img_filename: str):
         """
@@ -153,29 +225,129 @@ class World:
 
         This checks that the receiving robots are of the right type (specified by the Mesage), and
         that robots are within mutual communication range of each other.
+
+        To avoid checking every pair of robots, robots are sorted into square buckets the size of
+        the largest communication range (see :meth:`~gridsim.robot.Robot.get_comm_range`). Robots
+        with a known range only check the robots in the surrounding buckets. (With only a few
+        robots, all pairs of robots are checked instead.) The distances for all of these pairs of
+        robots are computed at once, and :meth:`~gridsim.robot.Robot.comm_mask` is only called for
+        robots whose communication criterion isn't just their range.
+
+        Messages are delivered in order of the sending robot, then the receiving robot. Each robot's
+        message is read when it's that robot's turn to send, so a message set in
+        :meth:`~gridsim.robot.Robot.receive_msg` is sent in the same step if the robot hasn't had
+        its turn yet.
         """
         # Clear the list of edges that the Viewer will draw
         self._viewer_comm_edges = []
-        # (SLOW) loop through all robot pairs
-        for tx_ind, tx_r in enumerate(self._robots):  # transmitting robot
+        robots = self._robot_list
+        num_robots = len(robots)
+        pos = self._pos[:num_robots]
+        # Find the receivers of the robots that already have a (non-empty) message all at once.
+        # Robots can also start sending in receive_msg, so these are only used if a robot's message
+        # and range are the same when it's its turn to send.
+        tx_inds = np.array([i for i, r in enumerate(robots) if r._tx_message], dtype=np.intp)
+        comm_ranges = [robots[i].get_comm_range() for i in tx_inds.tolist()]
+        has_range = np.array([c is not None for c in comm_ranges], dtype=bool)
+        known_ranges = [c for c in comm_ranges if c is not None]
+        # Squared communication range of each robot (infinite if unknown). Pairs beyond this range
+        # are dropped in both the bucketed and all-pairs checks below, so get_comm_range must return
+        # None for robots whose comm_criteria reaches further (as GridRobot does when it's changed).
+        range_sqr = np.full(num_robots, np.inf)
+        range_sqr[tx_inds[has_range]] = np.square(known_ranges)
+
+        # Find the pairs of (transmitting, receiving) robots that could communicate
+        if known_ranges and num_robots >= _MIN_ROBOTS_TO_BUCKET:
+            self._sort_buckets(pos, max(1, math.ceil(max(known_ranges))))
+            tx, rx = _bucket_neighbor_pairs(tx_inds[has_range], self._bucket_cells,
+                                            self._bucket_order, self._bucket_keys,
+                                            self._bucket_key_width)
+            # (SLOW) Unknown range, so check all robots
+            tx_all, rx_all = _all_pairs(tx_inds[~has_range], num_robots)
+            tx, rx = np.concatenate((tx, tx_all)), np.concatenate((rx, rx_all))
+        else:
+            tx, rx = _all_pairs(tx_inds, num_robots)
+
+        # Check the distances of all of the pairs at once
+        diff = pos[rx] - pos[tx]
+        dist_sqr = diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1]
+        # Robots don't receive their own messages, or messages from outside the sender's range
+        keep = (tx != rx) & (dist_sqr <= range_sqr[tx])
+        tx, rx, dist_sqr = tx[keep], rx[keep], dist_sqr[keep]
+        order = np.lexsort((rx, tx))
+        tx, rx, dist_sqr = tx[order], rx[order], dist_sqr[order]
+        starts = np.searchsorted(tx, tx_inds, side='left')
+        ends = np.searchsorted(tx, tx_inds, side='right')
+        found_pairs = {tx_ind: (comm_range, start, end) for tx_ind, comm_range, start, end
+                       in zip(tx_inds.tolist(), comm_ranges, starts.tolist(), ends.tolist())}
+        # (Slicing lists is faster than slicing arrays for the many robots with a few neighbors)
+        rx_list, dist_sqr_list = rx.tolist(), dist_sqr.tolist()
+
+        for tx_ind, tx_r in enumerate(robots):  # transmitting robot
             msg = tx_r.get_tx_message()
-            if msg:  # only transmit non-empty messages
-                for rx_ind, rx_r in enumerate(self._robots):  # receiving robot
-                    # Receiver must be target type (and not itself)
-                    if tx_r != rx_r and isinstance(rx_r, msg._rx_type):
-                        dist_sqr = tx_r._distance_sqr(rx_r.get_pos())
-                        # NOTE: This was changed after v0.5 to assume that communication (and
-                        # therefore comm_criteria()) is symmetric because it speeds up simulations
-                        if tx_r.comm_criteria(dist_sqr):
-                            # Receiving robot processes incoming message
-                            rx_r.receive_msg(msg, dist_sqr)
-                            # Tell sender that the message was received
-                            tx_r.msg_received()
-                            # Add this to the list of links/edges to draw if the Viewer is showing
-                            # the communication network
-                            if tx_ind < rx_ind:
-                                # (This makes sure each of the edge pairs is only drawn once)
-                                self._viewer_comm_edges.append((tx_r, rx_r))
+            if not msg:  # only transmit non-empty messages
+                continue
+            comm_range = tx_r.get_comm_range()
+            found = found_pairs.get(tx_ind)
+            range_only = _range_is_comm_criteria(type(tx_r))
+            if found is not None and found[0] == comm_range:
+                _, start, end = found
+                if range_only:
+                    rx_inds, rx_dist_sqr = rx_list[start:end], dist_sqr_list[start:end]
+                else:
+                    rx_inds, rx_dist_sqr = rx[start:end], dist_sqr[start:end]
+            else:
+                rx_inds, rx_dist_sqr = _comm_neighbors(pos, tx_ind, comm_range)
+                if range_only:
+                    rx_inds, rx_dist_sqr = rx_inds.tolist(), rx_dist_sqr.tolist()
+            # NOTE: This was changed after v0.5 to assume that communication (and
+            # therefore comm_criteria()) is symmetric because it speeds up simulations
+            if not range_only:
+                if rx_inds.size:
+                    in_range = tx_r.comm_mask(rx_dist_sqr)
+                    rx_inds, rx_dist_sqr = rx_inds[in_range], rx_dist_sqr[in_range]
+                rx_inds, rx_dist_sqr = rx_inds.tolist(), rx_dist_sqr.tolist()
+
+            for rx_ind, rx_dist in zip(rx_inds, rx_dist_sqr):
+                rx_r = robots[rx_ind]  # receiving robot
+                # Receiver must be target type
+                if isinstance(rx_r, msg._rx_type):
+                    # Receiving robot processes incoming message
+                    rx_r.receive_msg(msg, rx_dist)
+                    # Tell sender that the message was received
+                    tx_r.msg_received()
+                    # Add this to the list of links/edges to draw if the Viewer is showing
+                    # the communication network
+                    if tx_ind < rx_ind:
+                        # (This makes sure each of the edge pairs is only drawn once)
+                        self._viewer_comm_edges.append((tx_r, rx_r))
+
+    def _sort_buckets(self, pos: np.ndarray, bucket_size: int):
+        """
+        Sort robots into square buckets (a uniform grid) by their position, for finding nearby
+        robots with :func:`_bucket_neighbor_pairs`.
+
+        The sorted buckets are kept between steps, so they are only sorted again if a robot moved to
+        a different bucket (or the number of robots or bucket size changed).
+
+        Parameters
+        ----------
+        pos : np.ndarray
+            (N, 2) array of the (x, y) position of each robot in the World
+        bucket_size : int
+            Side length of the buckets (in grid cells)
+        """
+        cells = (pos // bucket_size).astype(np.int64)
+        if bucket_size == self._bucket_size and np.array_equal(cells, self._bucket_cells):
+            # No robots changed buckets
+            return
+        self._bucket_size = bucket_size
+        self._bucket_cells = cells
+        # Leave room for the neighbors of the first and last buckets, so they have valid keys
+        self._bucket_key_width = int(cells[:, 1].max()) + 3
+        keys = (cells[:, 0] + 1) * self._bucket_key_width + (cells[:, 1] + 1)
+        self._bucket_order = np.argsort(keys, kind='stable')
+        self._bucket_keys = keys[self._bucket_order]
 
     def get_dimensions(self) -> Tuple[int, int]:
         """
@@ -211,6 +383,47 @@ class World:
         """
         return self._robots
 
+    def get_robot_list(self) -> List[Robot]:
+        """
+        Get a list of all the robots in the World, in the order they were added (which is the same
+        order as :meth:`~gridsim.world.World.get_positions`). Unlike getting the list from
+        :meth:`~gridsim.world.World.get_robots`, this doesn't create a new list.
+
+        Returns
+        -------
+        List[Robot]
+            All Robots currently in the World. This is the World's own list, so don't modify it.
+        """
+        return self._robot_list
+
+    def get_positions(self) -> np.ndarray:
+        """
+        Get the current positions of all Robots in the World as a single array. This is much faster
+        than getting the position of each Robot individually (e.g., in a Logger aggregator).
+
+        Returns
+        -------
+        np.ndarray
+            (N, 2) array of the (x, y) grid position of each Robot, in the same order as
+            :meth:`~gridsim.world.World.get_robots`. This is a view of the World's data, so copy
+            it if you need to keep it.
+        """
+        return self._pos[:len(self._robots)]
+
+    def get_colors(self) -> np.ndarray:
+        """
+        Get the current colors of all Robots in the World as a single array. This is much faster
+        than reading the color of each Robot individually (e.g., in a Logger aggregator).
+
+        Returns
+        -------
+        np.ndarray
+            (N, 3) array of the (R, G, B) color of each Robot, in the same order as
+            :meth:`~gridsim.world.World.get_robots`. This is a view of the World's data, so copy
+            it if you need to keep it.
+        """
+        return self._colors[:len(self._robots)]
+
     def tag(self, pos: Tuple[int, int], color: Optional[Tuple[int, int, int]] = None):
         """
         Tag a cell position in the World with an RGB color to display in the viewer. There will be a
@@ -262,3 +475,157 @@ class World:
         alphas = self._tagged_pos[:, :, 3]
         count = np.count_nonzero(alphas)
         return count
+
+
+@functools.lru_cache(maxsize=None)
+def _uses_batch_move(robot_cls: type) -> bool:
+    """
+    Check whether robots of a class can be moved with
+    :meth:`~gridsim.grid_robot.GridRobot.batch_move`. That's the case for GridRobots that don't
+    change how the robot moves (by overriding ``update``, ``move``, or ``_move``).
+
+    Parameters
+    ----------
+    robot_cls : type
+        Class of Robot
+
+    Returns
+    -------
+    bool
+        Whether robots of this class can be moved all at once
+    """
+    return issubclass(robot_cls, GridRobot) and \
+        robot_cls.update is Robot.update and \
+        robot_cls.move is GridRobot.move and \
+        robot_cls._move is Robot._move
+
+
+@functools.lru_cache(maxsize=None)
+def _range_is_comm_criteria(robot_cls: type) -> bool:
+    """
+    Check whether the communication criterion for robots of a class is exactly that the other robot
+    is within the communication range. That's the case for GridRobots that don't override
+    ``comm_criteria`` or ``comm_mask``, so they don't need to check them.
+
+    Parameters
+    ----------
+    robot_cls : type
+        Class of Robot
+
+    Returns
+    -------
+    bool
+        Whether robots of this class can communicate with any robot within their range
+    """
+    return issubclass(robot_cls, GridRobot) and \
+        robot_cls.comm_criteria is GridRobot.comm_criteria and \
+        robot_cls.comm_mask is GridRobot.comm_mask
+
+
+def _all_pairs(tx_inds: np.ndarray, num_robots: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get all of the pairs of the given transmitting robots with every robot.
+
+    Parameters
+    ----------
+    tx_inds : np.ndarray
+        Indices of the transmitting robots
+    num_robots : int
+        Total number of robots
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices of the transmitting and receiving robot in each pair
+    """
+    return np.repeat(tx_inds, num_robots), np.tile(np.arange(num_robots), tx_inds.size)
+
+
+def _comm_neighbors(pos: np.ndarray, tx_ind: int, comm_range: Optional[float]) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get all of the robots within a single transmitting robot's communication range.
+
+    Parameters
+    ----------
+    pos : np.ndarray
+        (N, 2) array of the (x, y) position of each robot in the World
+    tx_ind : int
+        Index of the transmitting robot
+    comm_range : Optional[float]
+        Communication range of the transmitting robot, or None if it isn't known (so all robots are
+        included)
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices of the receiving robots and their squared distances from the transmitting robot
+    """
+    diff = pos - pos[tx_ind]
+    dist_sqr = diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1]
+    keep = dist_sqr <= (np.inf if comm_range is None else comm_range**2)
+    keep[tx_ind] = False
+    rx_inds = np.flatnonzero(keep)
+    return rx_inds, dist_sqr[rx_inds]
+
+
+# (x, y) offsets of a bucket and all of the buckets around it
+_NEIGHBOR_OFFSETS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+
+
+def _bucket_neighbor_pairs(tx_inds: np.ndarray, cells: np.ndarray, order: np.ndarray,
+                           sorted_keys: np.ndarray, key_width: int) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get all of the pairs of the given transmitting robots with the robots in the same or adjacent
+    buckets, without looping over robots in Python. Because the buckets are at least as big as the
+    communication range, this includes every robot that could be in range.
+
+    Parameters
+    ----------
+    tx_inds : np.ndarray
+        Indices of the transmitting robots
+    cells : np.ndarray
+        (N, 2) array of the (x, y) bucket of each robot
+    order : np.ndarray
+        Indices of the robots, sorted by bucket
+    sorted_keys : np.ndarray
+        Key of the bucket of each robot in ``order`` (``(x + 1) * key_width + (y + 1)``)
+    key_width : int
+        Multiplier for the x bucket in the keys, larger than the largest y bucket + 2
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Indices of the transmitting and receiving robot in each pair
+    """
+    # Keys of the 9 buckets around each transmitting robot
+    neighbor_cells = cells[tx_inds, np.newaxis, :] + 1 + _NEIGHBOR_OFFSETS
+    keys = (neighbor_cells[:, :, 0] * key_width + neighbor_cells[:, :, 1]).ravel()
+    # Robots in each bucket are a contiguous block of the sorted robots
+    starts = np.searchsorted(sorted_keys, keys, side='left')
+    counts = np.searchsorted(sorted_keys, keys, side='right') - starts
+    # Expand each block into one pair per robot in it
+    block_starts = np.cumsum(counts) - counts
+    sorted_inds = np.repeat(starts - block_starts, counts) + np.arange(counts.sum())
+    tx = np.repeat(np.repeat(tx_inds, len(_NEIGHBOR_OFFSETS)), counts)
+    return tx, order[sorted_inds]
+
+
+def _grow(arr: np.ndarray) -> np.ndarray:
+    """
+    Double the capacity (first dimension) of a per-robot array, keeping its contents.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array to grow
+
+    Returns
+    -------
+    np.ndarray
+        New array with at least twice the rows, with the original values at the start
+    """
+    new_arr = np.zeros((max(2 * arr.shape[0], 16),) + arr.shape[1:], dtype=arr.dtype)
+    new_arr[:arr.shape[0]] = arr
+    return new_arr
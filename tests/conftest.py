@@ -0,0 +1,22 @@
+import pytest
+
+import gridsim as gs
+from gridsim.grid_robot import GridRobot
+
+
+class StillRobot(GridRobot):
+    # Robot that doesn't do anything (shared by the tests)
+    def init(self):
+        self.set_color(10, 20, 30)
+
+    def loop(self):
+        pass
+
+    def receive_msg(self, msg: gs.Message, dist_sqr: float):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def gridsim_cache_dir(tmp_path, monkeypatch):
+    # Keep resized environment images cached by the tests out of the user's real cache directory
+    monkeypatch.setenv('GRIDSIM_CACHE_DIR', str(tmp_path / 'gridsim_cache'))
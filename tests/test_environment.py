@@ -0,0 +1,75 @@
+import numpy as np
+from PIL import Image
+
+from gridsim import environment
+from gridsim.environment import ImageEnvironment
+
+
+def make_env(tmp_path, observation_std=0.):
+    arr = np.random.randint(0, 256, size=(6, 8, 3), dtype=np.uint8)
+    filename = tmp_path / 'env.png'
+    Image.fromarray(arr).save(filename)
+    return ImageEnvironment(str(filename), (8, 6), observation_std=observation_std), arr
+
+
+def test_get(tmp_path):
+    env, arr = make_env(tmp_path)
+    assert env.get((3, 5)) == tuple(arr[5, 3])
+    assert env.get((8, 0)) is None
+    assert env.get((0, -1)) is None
+
+
+def test_get_many(tmp_path):
+    env, arr = make_env(tmp_path)
+    colors = env.get_many(np.array([[0, 0], [7, 5], [8, 5]]))
+    assert np.all(colors[0] == arr[0, 0])
+    assert np.all(colors[1] == arr[5, 7])
+    assert np.all(np.isnan(colors[2]))
+
+
+def test_noisy_observations(tmp_path):
+    env, arr = make_env(tmp_path, observation_std=2.)
+    color = env.get((1, 2))
+    assert len(color) == 3
+    assert all(isinstance(c, float) for c in color)
+
+    colors = env.get_many(np.zeros([1000, 2], dtype=int))
+    assert colors.shape == (1000, 3)
+    assert np.allclose(colors.mean(axis=0), arr[0, 0], atol=0.5)
+    assert np.allclose(colors.std(axis=0), 2., atol=0.5)
+
+
+def make_image(tmp_path):
+    arr = np.random.randint(0, 256, size=(12, 16, 3), dtype=np.uint8)
+    filename = tmp_path / 'env.png'
+    Image.fromarray(arr).save(filename)
+    return str(filename)
+
+
+def test_resized_image_cache(tmp_path):
+    filename = make_image(tmp_path)
+    env = ImageEnvironment(filename, (8, 6), cache=str(tmp_path / 'cache'))
+    assert env._world_arr.shape == (6, 8, 3)
+    assert len(list((tmp_path / 'cache').glob('env_*.npy'))) == 1
+    # Second load comes from the cache
+    env_cached = ImageEnvironment(filename, (8, 6), cache=str(tmp_path / 'cache'))
+    assert np.all(env_cached._world_arr == env._world_arr)
+
+
+def test_resized_image_cache_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv('GRIDSIM_CACHE_DIR', str(tmp_path / 'cache'))
+    ImageEnvironment(make_image(tmp_path), (8, 6), cache=False)
+    assert not (tmp_path / 'cache').exists()
+    # An empty environment variable also turns off caching
+    monkeypatch.setenv('GRIDSIM_CACHE_DIR', '')
+    assert environment._default_cache_dir() is None
+
+
+def test_default_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('GRIDSIM_CACHE_DIR', str(tmp_path / 'cache'))
+    ImageEnvironment(make_image(tmp_path), (8, 6))
+    assert len(list((tmp_path / 'cache').glob('env_*.npy'))) == 1
+
+    monkeypatch.delenv('GRIDSIM_CACHE_DIR')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    assert environment._default_cache_dir() == tmp_path / 'xdg' / 'gridsim'
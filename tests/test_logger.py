@@ -0,0 +1,301 @@
+import h5py
+import numpy as np
+import pytest
+
+import gridsim as gs
+
+from conftest import StillRobot
+
+
+def x_agg(robots):
+    return np.array([r.get_pos()[0] for r in robots], dtype=np.float64)
+
+
+def test_log_state_buffered(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1, buffer_size=4)
+    logger.add_aggregator('x', x_agg)
+    for _ in range(10):
+        world.step()
+        logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert list(f['trial_1/time']) == list(range(1, 11))
+        assert f['trial_1/x'].shape == (10, 3)
+        assert np.all(f['trial_1/x'][:] == [0, 1, 2])
+
+
+def test_aggregator_out(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1, buffer_size=3)
+    outs = []
+
+    def out_agg(robots, out=None):
+        if out is None:
+            return np.zeros(len(robots))
+        outs.append(out)
+        out[:] = world.get_time()
+        return out
+
+    logger.add_aggregator('t', out_agg)
+    for _ in range(5):
+        world.step()
+        logger.log_state()
+    logger.close()
+
+    assert len(outs) == 5
+    with h5py.File(filename, 'r') as f:
+        assert np.all(f['trial_1/t'][:] == np.arange(1, 6)[:, np.newaxis])
+
+
+def test_flush(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1, buffer_size=100)
+    logger.add_aggregator('x', x_agg)
+    for _ in range(5):
+        world.step()
+        logger.log_state()
+    logger.flush()
+    assert logger._log_file['trial_1/x'].shape == (5, 3)
+    assert list(logger._log_file['trial_1/time']) == list(range(1, 6))
+    logger.close()
+
+
+def test_log_state_after_close(tmp_path):
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(tmp_path / 'log.h5'), trial_num=1, buffer_size=1)
+    logger.add_aggregator('x', x_agg)
+    logger.close()
+    with pytest.raises(ValueError, match='closed'):
+        logger.log_state()
+    with pytest.raises(ValueError, match='closed'):
+        logger.flush()
+    # Closing again does nothing
+    logger.close()
+
+
+def test_reserved_aggregator_name(tmp_path):
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(tmp_path / 'log.h5'), trial_num=1)
+    with pytest.raises(ValueError, match='"params"'):
+        logger.add_aggregator('params', x_agg)
+    logger.close()
+
+
+def test_log_param_lists(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.log_param('ints', [1, 2, 3])
+    logger.log_param('mixed', [1, 2.5])
+    logger.log_param('np_value', np.float32(0.5))
+    with pytest.warns(UserWarning, match='Skipping parameter "strs"'):
+        logger.log_param('strs', [1, 'a'])
+    with pytest.warns(UserWarning, match='Skipping parameter "none"'):
+        logger.log_param('none', None)
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        params = f['trial_1/params']
+        assert list(params['ints']) == [1, 2, 3]
+        assert params['ints'].dtype.kind == 'i'
+        assert list(params['mixed']) == [1, 2.5]
+        assert params['np_value'][()] == 0.5
+        assert 'strs' not in params and 'none' not in params
+
+
+class NoSignatureAgg:
+    # Like some callables implemented in C, inspect can't get the signature of this
+    __signature__ = 'unknown'
+
+    def __call__(self, columns, out=None):
+        return columns['x']
+
+
+def test_aggregator_without_signature(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.add_aggregator('x', NoSignatureAgg(), columns=['x'])
+    assert not logger._agg_has_out['x']
+    world.step()
+    logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert np.all(f['trial_1/x'][:] == [[0, 1, 2]])
+
+
+def test_aggregator_columns(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 2 * i) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.add_aggregator('y', lambda c: c['y'], columns=['y'])
+    logger.add_aggregator('green', lambda c: c['color'][:, 1].astype(float), columns=['color'])
+    with pytest.raises(ValueError):
+        logger.add_aggregator('bad', lambda c: c['z'], columns=['z'])
+    world.step()
+    logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert np.all(f['trial_1/y'][:] == [[0, 2, 4]])
+        assert np.all(f['trial_1/green'][:] == [[20, 20, 20]])
+
+
+def test_compression(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1, compression='lzf')
+    logger.add_aggregator('x', x_agg)
+    logger.add_aggregator('mean_x', lambda robots: x_agg(robots).mean(keepdims=True))
+    world.step()
+    logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert f['trial_1/x'].compression == 'lzf'
+        assert f['trial_1/x'].shuffle
+        assert f['trial_1/mean_x'].compression is None
+        assert np.all(f['trial_1/x'][:] == [0, 1, 2])
+
+
+def test_log_params(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.log_params({'a': 1, 'b': 'text', 'c': {'d': 2.5, 'e': {'f': True}}})
+    logger.log_param('g', [1, 2], sub_group='sub/subsub')
+    with pytest.warns(UserWarning, match='Skipping parameter "c/h"'):
+        logger.log_params({'c': {'h': None}})
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        params = f['trial_1/params']
+        assert params['a'][()] == 1
+        assert params['b'][()] == b'text'
+        assert params['c/d'][()] == 2.5
+        assert params['c/e/f'][()]
+        assert list(params['sub/subsub/g']) == [1, 2]
+
+
+@pytest.mark.parametrize('buffer_size, chunk_size', [(4, None), (4, 3), (5, 10), (8, 2)])
+def test_chunk_writes(tmp_path, buffer_size, chunk_size):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1,
+                       buffer_size=buffer_size, chunk_size=chunk_size)
+    logger.add_aggregator('time_x', lambda robots: x_agg(robots) + world.get_time())
+    for _ in range(22):
+        world.step()
+        logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        time = np.arange(1, 23)
+        assert np.all(f['trial_1/time'][:] == time)
+        assert np.all(f['trial_1/time_x'][:] == time[:, np.newaxis] + [0, 1, 2])
+
+
+@pytest.mark.parametrize('kwargs', [{'buffer_size': 0}, {'chunk_size': 0}, {'chunk_size': -1}])
+def test_invalid_buffer_size(tmp_path, kwargs):
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        gs.Logger(world, str(tmp_path / 'log.h5'), trial_num=1, **kwargs)
+
+
+def test_default_chunk_size(tmp_path):
+    world = gs.World(100, 100, robots=[StillRobot(i % 100, i // 100) for i in range(1000)])
+    logger = gs.Logger(world, str(tmp_path / 'log.h5'), trial_num=1)
+    logger.add_aggregator('x', x_agg)
+    logger.add_aggregator('mean_x', lambda robots: x_agg(robots).mean(keepdims=True))
+    # Large chunks are limited to ~1 MB, but still divide evenly into the buffer
+    assert logger._agg_dsets['x'].chunks == (128, 1000)
+    assert logger._agg_dsets['mean_x'].chunks == (1024, 1)
+    assert logger._time_dset.chunks == (1024,)
+    logger.close()
+
+
+def test_log_state_without_aggregators(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    world.step()
+    logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert f['trial_1/time'].shape == (0,)
+
+
+def test_aggregator_dtype(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(i, 0) for i in range(3)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.add_aggregator('x', lambda c: c['x'], columns=['x'])
+    logger.add_aggregator('x32', lambda robots: x_agg(robots).astype(np.float32))
+    logger.add_aggregator('x16', x_agg, dtype='int16')
+    with pytest.raises(ValueError, match='1D'):
+        logger.add_aggregator('pos', lambda c: c['pos'], columns=['pos'])
+    with pytest.raises(ValueError, match='1D'):
+        logger.add_aggregator('list', lambda robots: [1., 2.])
+    with pytest.raises(ValueError, match='numeric'):
+        logger.add_aggregator('names', lambda robots: np.array([str(r) for r in robots]))
+    # Rejected aggregators aren't kept
+    assert set(logger._agg_has_out) == set(logger._agg_columns) == {'x', 'x32', 'x16'}
+    world.step()
+    logger.log_state()
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert f['trial_1/x'].dtype == np.int32
+        assert f['trial_1/x32'].dtype == np.float32
+        assert f['trial_1/x16'].dtype == np.int16
+        assert np.all(f['trial_1/x16'][:] == [[0, 1, 2]])
+        assert np.all(f['trial_1/x'][:] == [[0, 1, 2]])
+
+
+def test_log_system_info(tmp_path):
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    for trial in [1, 2]:
+        logger = gs.Logger(world, str(filename), trial_num=trial)
+        logger.log_system_info()
+        logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        for trial in [1, 2]:
+            info = f[f'trial_{trial}/system_info']
+            assert info['gridsim_version'][()].decode() == gs.__version__
+            assert 'datetime_local' in info
+
+
+def test_log_config_exclude(tmp_path):
+    config_file = tmp_path / 'config.yml'
+    config_file.write_text('a: 1\nb: [1, 2, 3]\nc: text\n')
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    logger.log_config(gs.ConfigParser(str(config_file)), exclude=['b'])
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert sorted(f['trial_1/params']) == ['a', 'c']
+
+
+def test_log_config_exclude_name(tmp_path):
+    config_file = tmp_path / 'config.yml'
+    config_file.write_text('name: test\nn: 1\na: 2\n')
+    filename = tmp_path / 'log.h5'
+    world = gs.World(10, 10, robots=[StillRobot(0, 0)])
+    logger = gs.Logger(world, str(filename), trial_num=1)
+    # A single name (not a list)
+    logger.log_config(gs.ConfigParser(str(config_file)), exclude='name')
+    logger.close()
+
+    with h5py.File(filename, 'r') as f:
+        assert sorted(f['trial_1/params']) == ['a', 'n']
@@ -0,0 +1,60 @@
+import pytest
+
+import gridsim as gs
+from gridsim.grid_robot import GridRobot
+
+
+def test_null_message():
+    msg = gs.Message()
+    assert not msg
+    assert msg.sender() is None
+    assert msg.get() == {}
+    with pytest.raises(TypeError):
+        msg.get()['a'] = 1
+    assert not gs.Message(None, {})
+
+
+class QuietRobot(GridRobot):
+    def init(self):
+        pass
+
+    def loop(self):
+        pass
+
+    def receive_msg(self, msg: gs.Message, dist_sqr: float):
+        pass
+
+
+def test_robot_starts_with_null_message():
+    robots = [QuietRobot(0, 0), QuietRobot(1, 1)]
+    assert not robots[0].get_tx_message()
+    with pytest.raises(ValueError):
+        robots[0].get_tx_message().set('a', 1)
+    assert robots[1].get_tx_message().get() == {}
+
+
+def test_message_default_content():
+    msg1, msg2 = gs.Message(1), gs.Message(2)
+    msg1.set('a', 1)
+    assert msg1.get() == {'a': 1}
+    assert msg2.get() == {}
+
+
+def test_message():
+    msg = gs.Message(3, {'a': 1}, rx_type=GridRobot)
+    assert msg
+    assert msg.sender() == 3
+    assert msg.get('a') == 1
+    assert not hasattr(msg, '__dict__')
+
+
+@pytest.mark.parametrize('content, rx_type', [
+    ({1: 'a'}, gs.Robot),
+    ({'a': 1, 2: 'b'}, gs.Robot),
+    ([('a', 1)], gs.Robot),
+    ({'a': 1}, int),
+    ({'a': 1}, 'Robot'),
+])
+def test_invalid_message(content, rx_type):
+    with pytest.raises(TypeError):
+        gs.Message(1, content, rx_type=rx_type)
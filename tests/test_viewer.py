@@ -0,0 +1,21 @@
+import pygame
+
+import gridsim as gs
+
+from conftest import StillRobot
+
+
+def test_robot_images_match_window(monkeypatch):
+    monkeypatch.setenv('SDL_VIDEODRIVER', 'dummy')
+    monkeypatch.setenv('HAS_SCREEN', '1')
+    robots = [StillRobot(0, 0), StillRobot(1, 1)]
+    world = gs.World(10, 10, robots=robots)
+    # Robot image made before there's a window, so it can't be converted to the window's format
+    robots[0]._sprite_setup(10)
+    image = robots[0].image
+    try:
+        gs.Viewer(world, window_width=100)
+        assert robots[0].image is not image
+        assert robots[0].image is robots[1].image
+    finally:
+        pygame.display.quit()
@@ -0,0 +1,292 @@
+import numpy as np
+import pytest
+
+import gridsim as gs
+from gridsim import world as world_module
+from gridsim.grid_robot import GridRobot
+
+from conftest import StillRobot
+
+
+class ChattyRobot(GridRobot):
+    def init(self):
+        self.set_tx_message(gs.Message(self.id, {'hi': 1}))
+        self.heard = set()
+
+    def loop(self):
+        self.heard = set()
+
+    def receive_msg(self, msg: gs.Message, dist_sqr: float):
+        self.heard.add(msg.sender())
+
+
+def expected_heard(robots, comm_range):
+    # Brute force check of all pairs
+    heard = {r.id: set() for r in robots}
+    for tx in robots:
+        for rx in robots:
+            if tx is not rx and tx.distance(rx.get_pos()) <= comm_range:
+                heard[rx.id].add(tx.id)
+    return heard
+
+
+@pytest.mark.parametrize('comm_range', [0.5, 3, 4.5, 12])
+def test_communication_matches_all_pairs(comm_range):
+    rng = np.random.default_rng(0)
+    robots = [ChattyRobot(int(x), int(y), comm_range=comm_range)
+              for x, y in rng.integers(0, 40, size=(150, 2))]
+    world = gs.World(40, 40, robots=robots)
+    world.step()
+    expected = expected_heard(robots, comm_range)
+    for r in robots:
+        assert r.heard == expected[r.id]
+
+
+class MovingChattyRobot(ChattyRobot):
+    def __init__(self, x, y, direction, **kwargs):
+        super().__init__(x, y, **kwargs)
+        self.set_direction(direction)
+
+
+def test_communication_matches_all_pairs_while_moving():
+    rng = np.random.default_rng(1)
+    robots = [MovingChattyRobot(int(x), int(y), GridRobot.DIRS[d], comm_range=3)
+              for x, y, d in rng.integers(0, 5, size=(100, 3)) * [4, 4, 1]]
+    world = gs.World(20, 20, robots=robots)
+    for _ in range(8):
+        world.step()
+        expected = expected_heard(robots, 3)
+        for r in robots:
+            assert r.heard == expected[r.id]
+
+
+class UnknownRangeRobot(gs.Robot):
+    # Doesn't tell the World its communication range
+    def init(self):
+        self.set_tx_message(gs.Message(self.id, {'hi': 1}))
+        self.heard = set()
+
+    def loop(self):
+        self.heard = set()
+
+    def move(self):
+        return self.get_pos()
+
+    def comm_criteria(self, dist_sqr):
+        return dist_sqr <= 4**2
+
+    def receive_msg(self, msg: gs.Message, dist_sqr: float):
+        self.heard.add(msg.sender())
+
+
+def test_communication_with_unknown_range():
+    rng = np.random.default_rng(2)
+    robots = [ChattyRobot(int(x), int(y), comm_range=3)
+              for x, y in rng.integers(0, 20, size=(60, 2))]
+    robots += [UnknownRangeRobot(int(x), int(y)) for x, y in rng.integers(0, 20, size=(5, 2))]
+    world = gs.World(20, 20, robots=robots)
+    world.step()
+    # Communication is checked with the sender's criterion
+    for rx in robots:
+        expected = {tx.id for tx in robots
+                    if tx is not rx and tx.comm_criteria(tx._distance_sqr(rx.get_pos()))}
+        assert rx.heard == expected
+
+
+class NearRobot(ChattyRobot):
+    # Custom criterion (only adjacent cells), so comm_mask has to use it
+    def comm_criteria(self, dist_sqr):
+        return dist_sqr <= 1
+
+
+def test_custom_comm_criteria():
+    robots = [NearRobot(0, 0), NearRobot(1, 0), NearRobot(2, 1), NearRobot(3, 3)]
+    world = gs.World(10, 10, robots=robots)
+    world.step()
+    assert [r.heard for r in robots] == [{robots[1].id}, {robots[0].id}, set(), set()]
+
+
+class WideRobot(ChattyRobot):
+    # Custom criterion that reaches further than the (default) communication range
+    def comm_criteria(self, dist_sqr):
+        return dist_sqr <= 10**2
+
+
+def test_wider_custom_comm_criteria():
+    # Few enough robots that all pairs are checked
+    robots = [WideRobot(0, 0), WideRobot(8, 0), WideRobot(19, 0)]
+    world = gs.World(20, 20, robots=robots)
+    world.step()
+    assert [r.heard for r in robots] == [{robots[1].id}, {robots[0].id}, set()]
+
+
+def test_wider_custom_comm_criteria_with_buckets():
+    # Enough robots that the World sorts them into buckets
+    robots = [WideRobot(0, 0), WideRobot(8, 0)]
+    robots += [WideRobot(30 + i % 10, 30 + i // 10) for i in range(38)]
+    assert len(robots) >= world_module._MIN_ROBOTS_TO_BUCKET
+    world = gs.World(50, 50, robots=robots)
+    world.step()
+    assert robots[0].heard == {robots[1].id}
+    assert robots[1].heard == {robots[0].id}
+    for rx in robots:
+        expected = {tx.id for tx in robots
+                    if tx is not rx and tx.comm_criteria(tx._distance_sqr(rx.get_pos()))}
+        assert rx.heard == expected
+
+
+class RelayRobot(ChattyRobot):
+    # Only starts sending after it hears another robot
+    def init(self):
+        self.heard = set()
+
+    def receive_msg(self, msg: gs.Message, dist_sqr: float):
+        super().receive_msg(msg, dist_sqr)
+        if not self.get_tx_message():
+            self.set_tx_message(gs.Message(self.id, {'hi': 1}))
+
+
+@pytest.mark.parametrize('num_others', [0, 40])
+def test_message_relayed_in_same_step(num_others):
+    robots = [ChattyRobot(0, 0, comm_range=1.5), RelayRobot(1, 0, comm_range=1.5),
+              RelayRobot(2, 0, comm_range=1.5)]
+    # Robots far away from the relay (enough of them that the World sorts robots into buckets)
+    robots += [StillRobot(30 + i % 10, 30 + i // 10) for i in range(num_others)]
+    world = gs.World(50, 50, robots=robots)
+    world.step()
+    # The relay sends the message it received before it's its turn to send
+    assert [r.heard for r in robots[:3]] == [{robots[1].id}, {robots[0].id, robots[2].id},
+                                             {robots[1].id}]
+
+
+def test_colors_match_robots():
+    robots = [StillRobot(i, i) for i in range(20)]
+    world = gs.World(30, 30, robots=robots)
+    robots[3].set_color(255, 0, 128)
+
+    colors = world.get_colors()
+    assert colors.shape == (20, 3)
+    for r, c in zip(world.get_robots(), colors):
+        assert tuple(c) == r._color
+
+
+def test_positions_match_robots():
+    robots = [StillRobot(i, 2 * i) for i in range(20)]
+    world = gs.World(40, 40, robots=robots)
+    robots[5].set_direction(GridRobot.DOWN)
+    world.step()
+
+    positions = world.get_positions()
+    assert positions.shape == (20, 2)
+    for r, p in zip(world.get_robots(), positions):
+        assert tuple(p) == r.get_pos()
+    assert robots[5].get_pos() == (5, 11)
+
+
+def test_robot_list():
+    robots = [StillRobot(i, 0) for i in range(5)]
+    world = gs.World(10, 10, robots=robots)
+    extra = StillRobot(9, 9)
+    world.add_robot(extra)
+    world.add_robot(robots[0])
+    assert world.get_robot_list() == robots + [extra]
+    assert world.get_robot_list() == world.get_robots().sprites()
+
+
+def test_invalid_color():
+    world = gs.World(10, 10, robots=[StillRobot(1, 1)])
+    with pytest.raises(ValueError):
+        world.get_robots().sprites()[0].set_color(0, 300, 0)
+    assert np.all(world.get_colors() == [10, 20, 30])
+
+
+@pytest.mark.parametrize('direction, expected', [
+    (GridRobot.STAY, (5, 5)),
+    (GridRobot.UP, (5, 4)),
+    (GridRobot.DOWN, (5, 6)),
+    (GridRobot.LEFT, (4, 5)),
+    (GridRobot.RIGHT, (6, 5)),
+])
+def test_grid_robot_move(direction, expected):
+    robot = StillRobot(5, 5)
+    world = gs.World(10, 10, robots=[robot])
+    robot.set_direction(direction)
+    world.step()
+    assert robot.get_pos() == expected
+
+
+class DiagonalRobot(StillRobot):
+    # Overrides move, so it isn't moved with the other GridRobots
+    def move(self):
+        x, y = self.get_pos()
+        return x + 1, y + 1
+
+
+def test_batch_move_stays_in_bounds():
+    robots = [StillRobot(0, 0), StillRobot(9, 5), DiagonalRobot(8, 8), StillRobot(3, 3)]
+    world = gs.World(10, 10, robots=robots)
+    for r, d in zip(robots, [GridRobot.LEFT, GridRobot.RIGHT, GridRobot.STAY, GridRobot.DOWN]):
+        r.set_direction(d)
+    world.step()
+    world.step()
+    assert [r.get_pos() for r in robots] == [(0, 0), (9, 5), (9, 9), (3, 5)]
+
+
+class TickRobot(StillRobot):
+    def init(self):
+        super().init()
+        self.move_ticks = []
+
+    def move(self):
+        self.move_ticks.append(self.get_tick())
+        return self.get_pos()
+
+
+def test_tick_advances_after_move():
+    robots = [TickRobot(1, 1), StillRobot(2, 2)]
+    world = gs.World(10, 10, robots=robots)
+    world.step()
+    world.step()
+    assert robots[0].move_ticks == [0, 1]
+    assert [r.get_tick() for r in robots] == [2, 2]
+
+
+def test_all_robots_batch_move_stays_in_bounds():
+    robots = [StillRobot(0, 0), StillRobot(9, 5), StillRobot(4, 9), StillRobot(3, 3)]
+    world = gs.World(10, 10, robots=robots)
+    for r, d in zip(robots, [GridRobot.UP, GridRobot.RIGHT, GridRobot.DOWN, GridRobot.LEFT]):
+        r.set_direction(d)
+    world.step()
+    world.step()
+    assert [r.get_pos() for r in robots] == [(0, 0), (9, 5), (4, 9), (1, 3)]
+
+
+@pytest.mark.parametrize('direction', ['sideways', True, 1.0, np.float64(1), 5])
+def test_grid_robot_invalid_direction(direction):
+    robot = StillRobot(5, 5)
+    with pytest.raises(ValueError):
+        robot.set_direction(direction)
+
+
+def test_distance():
+    robot = StillRobot(1, 2)
+    assert robot.distance((4, 6)) == 5.
+    assert robot._distance_sqr((4, 6)) == 25
+
+
+def test_sprite_images_shared():
+    robots = [StillRobot(0, 0), StillRobot(1, 1)]
+    gs.World(10, 10, robots=robots)
+    for r in robots:
+        r._sprite_setup(10)
+    assert robots[0].image is robots[1].image
+    robots[1].set_color(255, 0, 0)
+    assert tuple(robots[0].image.get_at((5, 5)))[:3] == (10, 20, 30)
+    assert tuple(robots[1].image.get_at((5, 5)))[:3] == (255, 0, 0)
+
+
+def test_unique_robot_ids():
+    robots = [StillRobot(0, 0) for _ in range(1000)]
+    ids = [r.id for r in robots]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)